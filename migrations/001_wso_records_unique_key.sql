@@ -0,0 +1,35 @@
+-- Unique key on wso_records for the scrapers' bulk upserts.
+--
+-- Every scraper writes with
+--   upsert(..., on_conflict="wso,age_category,gender,weight_class")
+-- which PostgREST turns into INSERT ... ON CONFLICT (wso, age_category, gender, weight_class).
+-- Postgres rejects that unless a unique index or constraint covers exactly those
+-- columns, so this must be applied BEFORE deploying the bulk-upsert scrapers.
+--
+-- Deploy: run this whole file once in the Supabase SQL editor (or psql against
+-- the project database). It is safe to re-run.
+--
+-- Step 1 removes duplicate rows left behind by the old per-record select/insert
+-- scrapers. For each (wso, age_category, gender, weight_class) it keeps the
+-- lowest id, which is the row the old code read back first and updated.
+-- Review the duplicates first with:
+--
+--   SELECT wso, age_category, gender, weight_class, count(*)
+--   FROM wso_records
+--   GROUP BY 1, 2, 3, 4
+--   HAVING count(*) > 1;
+
+BEGIN;
+
+DELETE FROM wso_records AS duplicate
+USING wso_records AS kept
+WHERE duplicate.wso = kept.wso
+  AND duplicate.age_category = kept.age_category
+  AND duplicate.gender = kept.gender
+  AND duplicate.weight_class = kept.weight_class
+  AND duplicate.id > kept.id;
+
+CREATE UNIQUE INDEX IF NOT EXISTS wso_records_wso_age_gender_weight_key
+  ON wso_records (wso, age_category, gender, weight_class);
+
+COMMIT;
@@ -10,21 +10,79 @@ For Florida WSO which uses a side-by-side layout with:
 """
 
 import os
-import sys
-import json
+import io
+import csv
 import argparse
-import re
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice, tee
+from dataclasses import dataclass, asdict
+from typing import List, Dict, Any, Iterable, Optional, Tuple
 from datetime import datetime
-from collections import defaultdict
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from supabase import create_client, Client
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# Path segment that precedes the spreadsheet ID in a Google Sheets URL
+_SHEET_ID_PREFIX = "/spreadsheets/d/"
+
+# Maximum number of tab CSVs fetched from Google Sheets at once
+_MAX_FETCH_WORKERS = 8
+
+# (connect, read) timeouts in seconds for Google Sheets and Discord requests
+_HTTP_TIMEOUT = (5, 30)
+
+# Maximum number of rows sent to Supabase in a single upsert request
+_UPSERT_BATCH_SIZE = 500
+
+# Lift label that marks the first row of a weight class
+_SNATCH = "Snatch"
+
+# Display names for record fields in Discord notifications
+_FIELD_LABELS = {"snatch_record": "Snatch", "cj_record": "C&J", "total_record": "Total"}
+
+
+def _create_http_session() -> requests.Session:
+    """Create a pooled HTTP session with retry/backoff on rate limits and server errors."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=_MAX_FETCH_WORKERS,
+        pool_maxsize=_MAX_FETCH_WORKERS,
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            # Only retry the idempotent sheet fetches; a retried webhook POST can post twice
+            allowed_methods=("GET",)
+        )
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _is_snatch(cell: str) -> bool:
+    """Check whether a lift cell is the "Snatch" label."""
+    # Cheap substring test first; only possible matches pay for strip()
+    return _SNATCH in cell and cell.strip() == _SNATCH
+
+
+@dataclass(slots=True)
+class WSORecord:
+    """A single scraped record; converted to a dict only when written to Supabase."""
+    wso: str
+    age_category: str
+    gender: str
+    weight_class: str
+    snatch_record: Optional[int]
+    cj_record: Optional[int]
+    total_record: Optional[int]
+
 
 class WSORecordsFloridaScraper:
     """Scraper for Florida WSO weightlifting records with side-by-side layout."""
@@ -59,6 +117,7 @@ class WSORecordsFloridaScraper:
         
         self.supabase_client = None
         self.discord_webhook_url = None
+        self.http = _create_http_session()
         
     def setup_supabase_client(self):
         """Set up Supabase client."""
@@ -86,7 +145,7 @@ class WSORecordsFloridaScraper:
         """
         return tab_name
     
-    def scrape_sheet(self) -> List[Dict[str, Any]]:
+    def scrape_sheet(self) -> List[WSORecord]:
         """
         Scrape all tabs from Florida sheet.
         
@@ -96,15 +155,24 @@ class WSORecordsFloridaScraper:
         sheet_id = self._extract_sheet_id(self.sheet_url)
         all_records = []
         
-        # Scrape each tab
+        tabs = []
         for tab_name, gid in self.tabs.items():
             if gid is None:
                 print(f"⚠️  Skipping {tab_name} - gid not configured")
                 continue
-                
+            tabs.append((tab_name, gid))
+        
+        # Scrape all tabs concurrently (network-bound), then report them in order
+        with ThreadPoolExecutor(max_workers=_MAX_FETCH_WORKERS) as executor:
+            futures = [
+                executor.submit(self._scrape_tab, sheet_id, gid, tab_name)
+                for tab_name, gid in tabs
+            ]
+        
+        for (tab_name, _), future in zip(tabs, futures):
             print(f"\nScraping {tab_name} tab...")
             try:
-                records = self._scrape_tab(sheet_id, gid, tab_name)
+                records = future.result()
                 all_records.extend(records)
                 print(f"✓ Found {len(records)} records in {tab_name}")
             except Exception as e:
@@ -114,31 +182,28 @@ class WSORecordsFloridaScraper:
     
     def _extract_sheet_id(self, url: str) -> str:
         """Extract sheet ID from URL."""
-        match = re.search(r'/spreadsheets/d/([a-zA-Z0-9-_]+)', url)
-        if not match:
+        sheet_id = url.partition(_SHEET_ID_PREFIX)[2].split("/", 1)[0].split("?", 1)[0].split("#", 1)[0]
+        if not sheet_id:
             raise ValueError("Invalid Google Sheets URL")
-        return match.group(1)
+        return sheet_id
     
-    def _scrape_tab(self, sheet_id: str, gid: str, tab_name: str) -> List[Dict[str, Any]]:
-        """Scrape a single tab."""
+    def _scrape_tab(self, sheet_id: str, gid: str, tab_name: str) -> List[WSORecord]:
+        """Scrape a single tab, parsing CSV rows as they stream in."""
         csv_url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&gid={gid}"
-        response = requests.get(csv_url)
-        
-        if response.status_code != 200:
-            raise Exception(f"Failed to fetch tab: {response.status_code}")
-        
-        # Parse CSV
-        import csv
-        import io
-        csv_reader = csv.reader(io.StringIO(response.text))
-        rows = list(csv_reader)
-        
-        # Parse the side-by-side layout
-        records = self._parse_side_by_side(rows, tab_name)
         
-        return records
+        with self.http.get(csv_url, stream=True, timeout=_HTTP_TIMEOUT) as response:
+            if response.status_code != 200:
+                raise Exception(f"Failed to fetch tab: {response.status_code}")
+            
+            # Parse CSV (Sheets exports UTF-8) straight off the socket; newline=""
+            # leaves line endings to csv so quoted multi-line cells stay intact
+            response.raw.decode_content = True
+            csv_reader = csv.reader(io.TextIOWrapper(response.raw, encoding="utf-8", newline=""))
+            
+            # Parse the side-by-side layout
+            return self._parse_side_by_side(csv_reader, tab_name)
     
-    def _parse_side_by_side(self, rows: List[List[str]], tab_name: str) -> List[Dict[str, Any]]:
+    def _parse_side_by_side(self, rows: Iterable[List[str]], tab_name: str) -> List[WSORecord]:
         """
         Parse side-by-side layout where Men are on left, Women are on right.
         
@@ -155,47 +220,56 @@ class WSORecordsFloridaScraper:
         last_men_weight = None
         last_women_weight = None
         
-        i = 0
-        while i < len(rows):
-            row = rows[i]
+        # Walk the rows once as (row, next, next+1) triplets: each Snatch row
+        # needs the C&J and Total rows below it. Two empty rows pad the end.
+        current, following, after = tee(chain(rows, ([], [])), 3)
+        triplets = zip(current, islice(following, 1, None), islice(after, 2, None))
+        # Only rows that start a weight class reach the per-side parsing
+        for row, cj_row, total_row in filter(self._starts_weight_class, triplets):
+            # Parse men's side (columns 0-5) only when its own lift column is Snatch
+            men_side = _is_snatch(row[1]) and self._parse_side(
+                row, cj_row, total_row, 0, "Men", age_category, last_men_weight
+            )
+            if men_side:
+                men_record, is_plus = men_side
+                records.append(men_record)
+                # Update last weight class if it's not a + category
+                if not is_plus:
+                    last_men_weight = men_record.weight_class
             
-            # Skip empty rows
-            if not row or len(row) < 10:
-                i += 1
-                continue
-            
-            # Check if this is a weight class row (has lift type in column 1 or 7)
-            men_lift = row[1].strip() if len(row) > 1 else ""
-            women_lift = row[7].strip() if len(row) > 7 else ""
-            
-            # If we have a "Snatch" in either position, this starts a weight class
-            if men_lift == "Snatch" or women_lift == "Snatch":
-                # Parse men's side (columns 0-5)
-                men_record = self._parse_side(row, 0, "Men", age_category, i, rows, last_men_weight)
-                if men_record:
-                    records.append(men_record)
-                    # Update last weight class if it's not a + category
-                    if not men_record['weight_class'].endswith('+'):
-                        last_men_weight = men_record['weight_class']
-                
-                # Parse women's side (columns 6-11)
-                women_record = self._parse_side(row, 6, "Women", age_category, i, rows, last_women_weight)
-                if women_record:
-                    records.append(women_record)
-                    # Update last weight class if it's not a + category
-                    if not women_record['weight_class'].endswith('+'):
-                        last_women_weight = women_record['weight_class']
-            
-            i += 1
+            # Parse women's side (columns 6-11) only when its own lift column is Snatch
+            women_side = _is_snatch(row[7]) and self._parse_side(
+                row, cj_row, total_row, 6, "Women", age_category, last_women_weight
+            )
+            if women_side:
+                women_record, is_plus = women_side
+                records.append(women_record)
+                # Update last weight class if it's not a + category
+                if not is_plus:
+                    last_women_weight = women_record.weight_class
         
         return records
     
-    def _parse_side(self, start_row: List[str], col_offset: int, gender: str, 
-                   base_age: str, row_idx: int, all_rows: List[List[str]], 
-                   last_weight: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    @staticmethod
+    def _starts_weight_class(triplet) -> bool:
+        """Check whether a row triplet starts a weight class ("Snatch" in column 1 or 7)."""
+        row = triplet[0]
+        if len(row) < 10:
+            return False
+        return _is_snatch(row[1]) or _is_snatch(row[7])
+    
+    def _parse_side(self, snatch_row: List[str], cj_row: List[str], total_row: List[str],
+                   col_offset: int, gender: str, age_category: str,
+                   last_weight: Optional[str] = None) -> Optional[Tuple[WSORecord, bool]]:
         """
         Parse one side (Men or Women) of the layout.
         
+        Each Florida tab is a single age group, so age_category is the tab's
+        label as-is. The C&J and Total rows are the two rows below snatch_row.
+        
+        Returns (record, is_plus), where is_plus marks a + weight class, or
+        None if the side has no weight class.
+        
         Columns (offset by col_offset):
         0: weight_class
         1: "Snatch"
@@ -206,158 +280,126 @@ class WSORecordsFloridaScraper:
         6: location
         """
         # Get weight class from first column
-        weight_class = start_row[col_offset].strip() if len(start_row) > col_offset else ""
+        weight_class = snatch_row[col_offset].strip() if len(snatch_row) > col_offset else ""
         
         # If weight class is empty but we have a last weight, this is the + category
         if not weight_class or weight_class == "":
             if last_weight:
                 weight_class = last_weight + "+"
+                is_plus = True
             else:
                 return None
-        
-        # Determine age category (refine based on weight class for Youth)
-        age_category = self._determine_age_category(base_age, weight_class, row_idx, all_rows)
-        
-        # Get Snatch value
-        snatch_val = start_row[col_offset + 2].strip() if len(start_row) > col_offset + 2 else ""
-        snatch = self._parse_int(snatch_val)
-        
-        # Get C&J value (next row)
-        cj = None
-        total = None
-        
-        if row_idx + 1 < len(all_rows):
-            cj_row = all_rows[row_idx + 1]
-            cj_val = cj_row[col_offset + 2].strip() if len(cj_row) > col_offset + 2 else ""
-            cj = self._parse_int(cj_val)
-        
-        # Get Total value (row after C&J)
-        if row_idx + 2 < len(all_rows):
-            total_row = all_rows[row_idx + 2]
-            total_val = total_row[col_offset + 2].strip() if len(total_row) > col_offset + 2 else ""
-            total = self._parse_int(total_val)
-        
+        else:
+            is_plus = weight_class.endswith('+')
+        
+        # Snatch, C&J and Total values share the value column of their rows
+        value_col = col_offset + 2
+        snatch, cj, total = (
+            self._parse_int(row[value_col].strip()) if len(row) > value_col else None
+            for row in (snatch_row, cj_row, total_row)
+        )
+        
+        return WSORecord(
+            wso=self.wso_name,
+            age_category=age_category,
+            gender=gender,
+            weight_class=weight_class,
+            snatch_record=snatch,
+            cj_record=cj,
+            total_record=total
+        ), is_plus
+    
+    @staticmethod
+    def _parse_int(value: str) -> Optional[int]:
+        """Parse integer value, return None if invalid or 0."""
+        if not value:
+            return None
+        # Fast path: plain digit strings skip the float() round-trip
+        if value.isdecimal():
+            parsed = int(value)
+        else:
+            try:
+                parsed = int(float(value))
+            except ValueError:
+                return None
+        # Convert 0 to None (Florida uses 0 for empty records)
+        return parsed or None
+    
+    def _load_existing_index(self) -> Dict[Tuple[str, str, str, str], Dict[str, Any]]:
+        """Fetch this WSO's existing records in one query, keyed by (wso, age_category, gender, weight_class)."""
+        existing = self.supabase_client.table("wso_records").select("*").eq("wso", self.wso_name).execute()
         return {
-            'wso': self.wso_name,
-            'age_category': age_category,
-            'gender': gender,
-            'weight_class': weight_class,
-            'snatch_record': snatch,
-            'cj_record': cj,
-            'total_record': total
+            (row["wso"], row["age_category"], row["gender"], row["weight_class"]): row
+            for row in existing.data
         }
     
-    def _determine_age_category(self, base_age: str, weight_class: str, 
-                                row_idx: int, all_rows: List[List[str]]) -> str:
+    def upsert_records(self, records: List[WSORecord]) -> None:
         """
-        Determine specific age category.
+        Upsert records to Supabase.
         
-        For Youth tab, need to distinguish U13 vs U17 based on position in sheet.
-        For Masters, need to extract age group from context.
+        Diffs against the WSO's existing records in memory, then writes all new
+        and changed records with bulk upserts on
+        (wso, age_category, gender, weight_class).
         """
-        if base_age == "Youth":
-            # Youth tab has two sections: 13 & Under and 14-17
-            # Check section headers in previous rows
-            for i in range(max(0, row_idx - 10), row_idx):
-                if i < len(all_rows):
-                    row = all_rows[i]
-                    row_text = " ".join(row).upper()
-                    if "13" in row_text and "UNDER" in row_text:
-                        return "U13"
-                    elif "14-17" in row_text or "14 - 17" in row_text:
-                        return "U17"
-            
-            # Default based on typical weight class ranges
-            # U13: lighter weights (36-65 for women, 40-65+ for men)
-            # U17: heavier weights (40-77+ for women, 48-94+ for men)
-            try:
-                weight_num = int(weight_class.replace("+", ""))
-                if weight_num <= 65:
-                    return "U13"
-                else:
-                    return "U17"
-            except:
-                return "U13"  # Default
-        
-        elif base_age == "Masters":
-            # Look for age group in nearby rows
-            for i in range(max(0, row_idx - 5), row_idx):
-                if i < len(all_rows):
-                    row = all_rows[i]
-                    row_text = " ".join(row)
-                    # Look for patterns like "35-39", "40-44", etc.
-                    match = re.search(r'(\d{2})\s*-\s*(\d{2})', row_text)
-                    if match:
-                        lower_age = match.group(1)
-                        return f"Masters {lower_age}"
-            return "Masters 35"  # Default
-        
-        return base_age
-    
-    def _parse_int(self, value: str) -> Optional[int]:
-        """Parse integer value, return None if invalid or 0."""
-        if not value or value == "":
-            return None
-        try:
-            parsed = int(float(value))
-            # Convert 0 to None (Florida uses 0 for empty records)
-            return None if parsed == 0 else parsed
-        except ValueError:
-            return None
-    
-    def upsert_records(self, records: List[Dict[str, Any]]) -> None:
-        """Upsert records to Supabase."""
+        # Fetch all existing records for this WSO once and diff in memory
+        existing_by_key = self._load_existing_index()
+        
+        # Keyed so a duplicate record in the scrape replaces the earlier one
+        to_upsert = {}
+        
         for record in records:
-            existing = self.supabase_client.table("wso_records").select("*").match({
-                "wso": record["wso"],
-                "age_category": record["age_category"],
-                "gender": record["gender"],
-                "weight_class": record["weight_class"]
-            }).execute()
+            key = (record.wso, record.age_category, record.gender, record.weight_class)
+            existing_record = existing_by_key.get(key)
             
-            if existing.data and len(existing.data) > 0:
-                existing_record = existing.data[0]
-                record_id = existing_record["id"]
-                
+            if existing_record is not None:
                 changes = {}
-                if existing_record.get("snatch_record") != record.get("snatch_record"):
+                if existing_record.get("snatch_record") != record.snatch_record:
                     changes["snatch_record"] = {
                         "old": existing_record.get("snatch_record"),
-                        "new": record.get("snatch_record")
+                        "new": record.snatch_record
                     }
-                if existing_record.get("cj_record") != record.get("cj_record"):
+                if existing_record.get("cj_record") != record.cj_record:
                     changes["cj_record"] = {
                         "old": existing_record.get("cj_record"),
-                        "new": record.get("cj_record")
+                        "new": record.cj_record
                     }
-                if existing_record.get("total_record") != record.get("total_record"):
+                if existing_record.get("total_record") != record.total_record:
                     changes["total_record"] = {
                         "old": existing_record.get("total_record"),
-                        "new": record.get("total_record")
+                        "new": record.total_record
                     }
                 
                 if changes:
-                    self.supabase_client.table("wso_records").update(record).eq("id", record_id).execute()
+                    # Later duplicates in the scrape are diffed against this row
+                    to_upsert[key] = existing_by_key[key] = asdict(record)
                     self.changes["updated"].append({
-                        "wso": record["wso"],
-                        "age_category": record["age_category"],
-                        "gender": record["gender"],
-                        "weight_class": record["weight_class"],
+                        "wso": record.wso,
+                        "age_category": record.age_category,
+                        "gender": record.gender,
+                        "weight_class": record.weight_class,
                         "changes": changes
                     })
-                    print(f"  ✓ Updated: {record['age_category']} {record['gender']} {record['weight_class']}")
+                    print(f"  ✓ Updated: {record.age_category} {record.gender} {record.weight_class}")
             else:
-                self.supabase_client.table("wso_records").insert(record).execute()
+                to_upsert[key] = existing_by_key[key] = asdict(record)
                 self.changes["inserted"].append({
-                    "wso": record["wso"],
-                    "age_category": record["age_category"],
-                    "gender": record["gender"],
-                    "weight_class": record["weight_class"],
-                    "snatch_record": record.get("snatch_record"),
-                    "cj_record": record.get("cj_record"),
-                    "total_record": record.get("total_record")
+                    "wso": record.wso,
+                    "age_category": record.age_category,
+                    "gender": record.gender,
+                    "weight_class": record.weight_class,
+                    "snatch_record": record.snatch_record,
+                    "cj_record": record.cj_record,
+                    "total_record": record.total_record
                 })
-                print(f"  ✓ Inserted: {record['age_category']} {record['gender']} {record['weight_class']}")
+                print(f"  ✓ Inserted: {record.age_category} {record.gender} {record.weight_class}")
+        
+        # Write all inserts and updates in bulk, chunked to stay under payload limits
+        rows = list(to_upsert.values())
+        for start in range(0, len(rows), _UPSERT_BATCH_SIZE):
+            self.supabase_client.table("wso_records").upsert(
+                rows[start:start + _UPSERT_BATCH_SIZE],
+                on_conflict="wso,age_category,gender,weight_class"
+            ).execute()
     
     def send_discord_notification(self) -> None:
         """Send Discord notification."""
@@ -383,50 +425,42 @@ class WSORecordsFloridaScraper:
             fields = []
             
             if total_inserted > 0:
-                inserted_text = []
-                for record in self.changes["inserted"][:10]:
-                    lifts = []
-                    if record.get("snatch_record"):
-                        lifts.append(f"Snatch: {record['snatch_record']}kg")
-                    if record.get("cj_record"):
-                        lifts.append(f"C&J: {record['cj_record']}kg")
-                    if record.get("total_record"):
-                        lifts.append(f"Total: {record['total_record']}kg")
-                    
-                    lifts_str = ", ".join(lifts) if lifts else "No records"
-                    inserted_text.append(
-                        f"• **{record['age_category']}** | {record['gender']} | {record['weight_class']}\n  {lifts_str}"
-                    )
+                def format_inserted(record: Dict[str, Any]) -> str:
+                    lifts_str = ", ".join(
+                        f"{label}: {record[field]}kg"
+                        for field, label in _FIELD_LABELS.items() if record.get(field)
+                    ) or "No records"
+                    return f"• **{record['age_category']}** | {record['gender']} | {record['weight_class']}\n  {lifts_str}"
                 
+                inserted_text = "\n".join(map(format_inserted, self.changes["inserted"][:10]))
                 if total_inserted > 10:
-                    inserted_text.append(f"_...and {total_inserted - 10} more_")
+                    inserted_text += f"\n_...and {total_inserted - 10} more_"
                 
                 fields.append({
                     "name": "🆕 New Records",
-                    "value": "\n".join(inserted_text),
+                    "value": inserted_text,
                     "inline": False
                 })
             
             if total_updated > 0:
-                updated_text = []
-                for record in self.changes["updated"][:10]:
-                    changes_str = []
-                    for field, change in record["changes"].items():
-                        field_name = field.replace("_record", "").replace("cj", "C&J").title()
-                        old = f"{change['old']}kg" if change['old'] else "None"
-                        new = f"{change['new']}kg" if change['new'] else "None"
-                        changes_str.append(f"{field_name}: {old} → {new}")
-                    
-                    updated_text.append(
-                        f"• **{record['age_category']}** | {record['gender']} | {record['weight_class']}\n  {', '.join(changes_str)}"
+                def format_change(field: str, change: Dict[str, Any]) -> str:
+                    old = f"{change['old']}kg" if change['old'] else "None"
+                    new = f"{change['new']}kg" if change['new'] else "None"
+                    return f"{_FIELD_LABELS[field]}: {old} → {new}"
+                
+                def format_updated(record: Dict[str, Any]) -> str:
+                    changes_str = ", ".join(
+                        format_change(field, change) for field, change in record["changes"].items()
                     )
+                    return f"• **{record['age_category']}** | {record['gender']} | {record['weight_class']}\n  {changes_str}"
                 
+                updated_text = "\n".join(map(format_updated, self.changes["updated"][:10]))
                 if total_updated > 10:
-                    updated_text.append(f"_...and {total_updated - 10} more_")
+                    updated_text += f"\n_...and {total_updated - 10} more_"
                 
                 fields.append({
                     "name": "📝 Updated Records",
-                    "value": "\n".join(updated_text),
+                    "value": updated_text,
                     "inline": False
                 })
             
@@ -440,8 +474,9 @@ class WSORecordsFloridaScraper:
             }
             payload = {"embeds": [embed]}
         
+        # The (connect, read) timeout bounds how long a slow webhook can hold up the run
         try:
-            response = requests.post(self.discord_webhook_url, json=payload)
+            response = self.http.post(self.discord_webhook_url, json=payload, timeout=_HTTP_TIMEOUT)
             response.raise_for_status()
             print("✓ Discord notification sent")
         except Exception as e:
@@ -475,32 +510,27 @@ class WSORecordsFloridaScraper:
         
         print("Done!")
     
-    def _dry_run_comparison(self, scraped_records: List[Dict[str, Any]]):
+    def _dry_run_comparison(self, scraped_records: List[WSORecord]):
         """Compare scraped records with database without making changes."""
         to_insert = []
         to_update = []
         
+        existing_by_key = self._load_existing_index()
+        
         for record in scraped_records:
             # Check if record exists in database
-            existing = self.supabase_client.table("wso_records").select("*").eq(
-                "wso", record["wso"]
-            ).eq(
-                "age_category", record["age_category"]
-            ).eq(
-                "gender", record["gender"]
-            ).eq(
-                "weight_class", record["weight_class"]
-            ).execute()
+            db_record = existing_by_key.get(
+                (record.wso, record.age_category, record.gender, record.weight_class)
+            )
             
-            if existing.data:
+            if db_record is not None:
                 # Record exists, check if values changed
-                db_record = existing.data[0]
                 changed = False
                 changes = []
                 
                 for field in ["snatch_record", "cj_record", "total_record"]:
                     db_val = db_record.get(field)
-                    new_val = record.get(field)
+                    new_val = getattr(record, field)
                     if db_val != new_val:
                         changed = True
                         changes.append(f"{field}: {db_val} → {new_val}")
@@ -522,7 +552,7 @@ class WSORecordsFloridaScraper:
         if to_insert:
             print(f"\n➕ New records ({len(to_insert)}):")
             for rec in to_insert[:5]:  # Show first 5
-                print(f"  - {rec['age_category']} {rec['gender']} {rec['weight_class']}")
+                print(f"  - {rec.age_category} {rec.gender} {rec.weight_class}")
             if len(to_insert) > 5:
                 print(f"  ... and {len(to_insert) - 5} more")
         
@@ -530,7 +560,7 @@ class WSORecordsFloridaScraper:
             print(f"\n🔄 Updated records ({len(to_update)}):")
             for item in to_update[:5]:  # Show first 5
                 rec = item['record']
-                print(f"  - {rec['age_category']} {rec['gender']} {rec['weight_class']}")
+                print(f"  - {rec.age_category} {rec.gender} {rec.weight_class}")
                 for change in item['changes']:
                     print(f"    {change}")
             if len(to_update) > 5:
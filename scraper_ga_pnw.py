@@ -8,16 +8,120 @@ where each row represents a single lift record.
 
 import os
 import sys
+import io
+import csv
 import json
 import argparse
+import functools
 import re
-from typing import List, Dict, Any
-from datetime import datetime
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Iterable, Iterator, Optional
+from datetime import datetime, timezone
 
 import requests
 from supabase import create_client, Client
 
+# Timeout in seconds for Google Sheets and Discord requests
+_HTTP_TIMEOUT = 30
+
+# Maximum number of rows sent to Supabase in a single upsert request
+_UPSERT_BATCH_SIZE = 500
+
+# Maximum number of upsert batches in flight at once
+_MAX_UPSERT_WORKERS = 4
+
+# Sheet columns read by scrape_sheet, in the order they are unpacked
+_FLAT_COLUMNS = ("ageGroup", "gender", "bodyWeightMin", "bodyWeightMax", "lift", "record")
+
+# Lift labels (lowercased) mapped to their [snatch, cj, total] slot index
+_LIFT_SLOTS = {
+    "snatch": 0,
+    "clean & jerk": 1,
+    "clean and jerk": 1,
+    "c&j": 1,
+    "cleanjerk": 1,
+    "total": 2,
+}
+
+# Sheet gender codes mapped to the gender labels stored in Supabase
+_GENDERS = {"F": "Women", "M": "Men"}
+
+# Record fields compared when diffing against Supabase
+_LIFT_FIELDS = ("snatch_record", "cj_record", "total_record")
+
+# Display names for record fields in Discord notifications
+_FIELD_LABELS = {"snatch_record": "Snatch", "cj_record": "C&J", "total_record": "Total"}
+
+# Discord embed colors and footer
+_COLOR_BLUE = 5814783
+_COLOR_GREEN = 3066993
+_EMBED_FOOTER = {"text": "WSO Records Scraper"}
+
+# "Open" age group with an optional suffix (e.g. " ADAP")
+_OPEN_RE = re.compile(r'^(open)(.*)$', re.IGNORECASE)
+
+# Masters age group: M/W followed by the age and an optional suffix
+_MASTERS_RE = re.compile(r'^[MW](\d+)(.*)$', re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=512)
+def _normalize_age_group(age_group: str) -> str:
+    """
+    Normalize age group to match Ohio convention.
+    
+    Cached, since a sheet repeats the same few dozen labels on every row.
+    
+    Conversions:
+    - JR, JR ADAP -> Junior, Junior ADAP
+    - Open, Open ADAP, OPEN -> Senior, Senior ADAP
+    - M35, W35 -> Masters 35 (M/W prefix removed, gender is separate)
+    - M40 ADAP -> Masters 40 ADAP
+    - U11, U13, U15, U17 -> keep as is
+    """
+    age_group = age_group.strip()
+    age_group_upper = age_group.upper()
+    
+    # Handle JR -> Junior (case-insensitive)
+    if age_group_upper.startswith('JR'):
+        return age_group.replace('JR', 'Junior', 1).replace('jr', 'Junior', 1)
+    
+    # Handle Open/OPEN -> Senior (case-insensitive)
+    if age_group_upper.startswith('OPEN'):
+        # Preserve suffix (e.g., " ADAP") if present
+        match = _OPEN_RE.match(age_group)
+        if match:
+            suffix = match.group(2)
+            return f"Senior{suffix}"
+    
+    # Handle M35, M40, W35, W40, etc. -> Masters 35, Masters 40
+    # Pattern: M/W followed by digits
+    match = _MASTERS_RE.match(age_group)
+    if match:
+        age_num = match.group(1)
+        suffix = match.group(2)  # e.g., " ADAP"
+        return f"Masters {age_num}{suffix}"
+    
+    # Return as-is for U11, U13, U15, U17, etc.
+    return age_group
+
+
+@functools.lru_cache(maxsize=128)
+def _weight_class(weight_min: str, weight_max: str) -> Optional[str]:
+    """
+    Determine the weight class from the bodyWeightMin/bodyWeightMax cells.
+    
+    If bodyWeightMax is empty but bodyWeightMin has a value, it means ">X"
+    (e.g., >63); otherwise bodyWeightMax is used. Returns None if both are
+    empty. Cached, since each (min, max) pair repeats for every lift.
+    """
+    if not weight_max and weight_min:
+        # Empty max means "greater than min" -> use min with + suffix
+        return weight_min + "+"
+    if weight_max:
+        # Use max value, replace > with + suffix
+        return weight_max.replace(">", "") + "+" if ">" in weight_max else weight_max
+    return None
+
 
 class WSORecordsFlatScraper:
     """Scraper for WSO weightlifting records in flat CSV format."""
@@ -32,6 +136,9 @@ class WSORecordsFlatScraper:
         self.supabase_client = None
         self.discord_webhook_url = None
         
+        # One keep-alive session for the sheet fetch and the Discord post
+        self.http = requests.Session()
+        
     def setup_supabase_client(self):
         """Set up Supabase client."""
         supabase_url = os.getenv("SUPABASE_URL")
@@ -50,51 +157,17 @@ class WSORecordsFlatScraper:
             raise ValueError("DISCORD_WEBHOOK_URL environment variable not set")
         print("✓ Discord webhook configured")
     
-    def _normalize_age_group(self, age_group: str) -> str:
-        """
-        Normalize age group to match Ohio convention.
-        
-        Conversions:
-        - JR, JR ADAP -> Junior, Junior ADAP
-        - Open, Open ADAP, OPEN -> Senior, Senior ADAP
-        - M35, W35 -> Masters 35 (M/W prefix removed, gender is separate)
-        - M40 ADAP -> Masters 40 ADAP
-        - U11, U13, U15, U17 -> keep as is
-        """
-        age_group = age_group.strip()
-        age_group_upper = age_group.upper()
-        
-        # Handle JR -> Junior (case-insensitive)
-        if age_group_upper.startswith('JR'):
-            return age_group.replace('JR', 'Junior', 1).replace('jr', 'Junior', 1)
-        
-        # Handle Open/OPEN -> Senior (case-insensitive)
-        if age_group_upper.startswith('OPEN'):
-            # Preserve suffix (e.g., " ADAP") if present
-            import re
-            match = re.match(r'^(open)(.*)$', age_group, re.IGNORECASE)
-            if match:
-                suffix = match.group(2)
-                return f"Senior{suffix}"
-        
-        # Handle M35, M40, W35, W40, etc. -> Masters 35, Masters 40
-        # Pattern: M/W followed by digits
-        import re
-        match = re.match(r'^[MW](\d+)(.*)$', age_group, re.IGNORECASE)
-        if match:
-            age_num = match.group(1)
-            suffix = match.group(2)  # e.g., " ADAP"
-            return f"Masters {age_num}{suffix}"
-        
-        # Return as-is for U11, U13, U15, U17, etc.
-        return age_group
-    
     def scrape_sheet(self) -> List[Dict[str, Any]]:
+        """Scrape data from Google Sheet in flat CSV format as a list (see iter_records)."""
+        return list(self.iter_records())
+    
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
         """
-        Scrape data from Google Sheet in flat CSV format.
+        Scrape data from Google Sheet in flat CSV format, yielding one record
+        per (age_category, gender, weight_class) group.
         
-        Returns:
-            List of records with structure:
+        Yields:
+            Records with structure:
             {
                 'wso': str,
                 'age_category': str,
@@ -117,136 +190,155 @@ class WSORecordsFlatScraper:
         
         # Fetch CSV data
         csv_url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-        response = requests.get(csv_url)
-        
-        if response.status_code != 200:
-            raise Exception(f"Failed to fetch sheet: {response.status_code}")
-        
-        # Parse CSV
-        import csv
-        import io
-        csv_data = csv.DictReader(io.StringIO(response.text))
         
-        # Group records by age_category + gender + weight_class
-        grouped = defaultdict(lambda: {'snatch': None, 'cj': None, 'total': None})
+        # Group records by age_category + gender + weight_class into
+        # [snatch, cj, total] slots
+        grouped = {}
         
-        for row in csv_data:
-            # Extract fields
-            age_group_raw = row.get('ageGroup', '').strip()
-            gender_raw = row.get('gender', '').strip()
-            weight_min = row.get('bodyWeightMin', '').strip()
-            weight_max = row.get('bodyWeightMax', '').strip()
-            lift_type = row.get('lift', '').strip()
-            record_value = row.get('record', '').strip()
+        # Stream the CSV and parse rows as they arrive
+        with self.http.get(csv_url, stream=True, timeout=_HTTP_TIMEOUT) as response:
+            if response.status_code != 200:
+                raise Exception(f"Failed to fetch sheet: {response.status_code}")
             
-            # Skip empty rows
-            if not age_group_raw or not gender_raw:
-                continue
+            # Parse CSV (Sheets exports UTF-8) straight off the socket; newline=""
+            # leaves line endings to csv so quoted multi-line cells stay intact
+            response.raw.decode_content = True
+            csv_data = csv.reader(io.TextIOWrapper(response.raw, encoding="utf-8", newline=""))
             
-            # Convert gender: F -> Women, M -> Men
-            gender = "Women" if gender_raw == "F" else "Men" if gender_raw == "M" else None
-            if not gender:
-                continue
+            # Resolve column positions from the header once; a missing column
+            # points one past the header and reads as an empty cell
+            header = next(csv_data, [])
+            positions = {name: i for i, name in enumerate(header)}
+            age_col, gender_col, min_col, max_col, lift_col, record_col = (
+                positions.get(name, len(header)) for name in _FLAT_COLUMNS
+            )
+            row_len = len(header) if positions.keys() >= set(_FLAT_COLUMNS) else len(header) + 1
             
-            # Normalize age group to match Ohio convention
-            age_group = self._normalize_age_group(age_group_raw)
+            # Bind per-row lookups once; every row goes through all of them
+            gender_for = _GENDERS.get
+            lift_slot_for = _LIFT_SLOTS.get
+            group_for = grouped.get
             
-            # Skip ADAP (adaptive) records
-            if 'ADAP' in age_group:
-                continue
-            
-            # Determine weight class:
-            # If bodyWeightMax is empty but bodyWeightMin has a value, it means ">X" (e.g., >63)
-            # Otherwise use bodyWeightMax
-            if not weight_max and weight_min:
-                # Empty max means "greater than min" -> use min with + suffix
-                weight_class = weight_min + "+"
-            elif weight_max:
-                # Use max value, replace > with + suffix
-                weight_class = weight_max.replace(">", "") + "+" if ">" in weight_max else weight_max
-            else:
-                # Both empty - skip this record
-                continue
-            
-            # Parse record value
-            record_int = None
-            if record_value:
-                try:
-                    record_int = int(float(record_value))
-                except ValueError:
-                    pass
-            
-            # Create unique key
-            key = (age_group, gender, weight_class)
-            
-            # Store the lift value (case-insensitive matching)
-            lift_type_lower = lift_type.lower()
-            if lift_type_lower == "snatch":
-                grouped[key]['snatch'] = record_int
-            elif lift_type_lower in ["clean & jerk", "clean and jerk", "c&j", "cleanjerk"]:
-                grouped[key]['cj'] = record_int
-            elif lift_type_lower == "total":
-                grouped[key]['total'] = record_int
+            for row in csv_data:
+                # Skip blank lines; pad short rows so every column reads as a cell
+                if not row:
+                    continue
+                if len(row) < row_len:
+                    row += [''] * (row_len - len(row))
+                
+                # Skip empty rows, stripping only the cells the checks need
+                age_group_raw = row[age_col].strip()
+                if not age_group_raw:
+                    continue
+                
+                # Convert gender: F -> Women, M -> Men
+                gender = gender_for(row[gender_col].strip())
+                if gender is None:
+                    continue
+                
+                # Resolve the lift slot (case-insensitive); skip unknown lifts early
+                lift_type = row[lift_col].strip()
+                if not lift_type:
+                    continue
+                lift_idx = lift_slot_for(lift_type.lower())
+                if lift_idx is None:
+                    continue
+                
+                # Normalize age group to match Ohio convention
+                age_group = _normalize_age_group(age_group_raw)
+                
+                # Skip ADAP (adaptive) records
+                if 'ADAP' in age_group:
+                    continue
+                
+                # Determine weight class; skip the record if both bounds are empty
+                weight_class = _weight_class(row[min_col].strip(), row[max_col].strip())
+                if weight_class is None:
+                    continue
+                
+                # Parse record value
+                record_value = row[record_col].strip()
+                record_int = None
+                if record_value:
+                    # Most cells are plain integers; only decimals need float()
+                    try:
+                        record_int = int(record_value)
+                    except ValueError:
+                        try:
+                            record_int = int(float(record_value))
+                        except ValueError:
+                            pass
+                
+                # Create unique key
+                key = (age_group, gender, weight_class)
+                
+                # Store the lift value
+                slots = group_for(key)
+                if slots is None:
+                    slots = grouped[key] = [None, None, None]
+                slots[lift_idx] = record_int
         
-        # Convert grouped data to list of records
-        records = []
-        for (age_cat, gender, weight_class), lifts in grouped.items():
-            records.append({
+        # Yield grouped data as records
+        for (age_cat, gender, weight_class), (snatch, cj, total) in grouped.items():
+            yield {
                 'wso': self.wso_name,
                 'age_category': age_cat,
                 'gender': gender,
                 'weight_class': weight_class,
-                'snatch_record': lifts['snatch'],
-                'cj_record': lifts['cj'],
-                'total_record': lifts['total']
-            })
-        
-        return records
+                'snatch_record': snatch,
+                'cj_record': cj,
+                'total_record': total
+            }
     
-    def upsert_records(self, records: List[Dict[str, Any]]) -> None:
+    def upsert_records(self, records: Iterable[Dict[str, Any]]) -> int:
         """
         Upsert records to Supabase.
         
-        Tracks changes (inserts vs updates) in self.changes.
+        Tracks changes (inserts vs updates) in self.changes, then writes all
+        new and changed records with bulk upserts on
+        (wso, age_category, gender, weight_class).
         
         Args:
-            records: List of records to upsert
+            records: Records to upsert; consumed once, so a generator works
+        
+        Returns:
+            Number of records processed
         """
-        for record in records:
-            # Query for existing record with same unique key
-            existing = self.supabase_client.table("wso_records").select("*").match({
-                "wso": record["wso"],
-                "age_category": record["age_category"],
-                "gender": record["gender"],
-                "weight_class": record["weight_class"]
-            }).execute()
+        # Fetch all existing records for this WSO in one query and diff in memory
+        existing = self.supabase_client.table("wso_records").select(
+            "age_category,gender,weight_class,snatch_record,cj_record,total_record"
+        ).eq("wso", self.wso_name).execute()
+        existing_by_key = {
+            (row["age_category"], row["gender"], row["weight_class"]): row
+            for row in existing.data
+        }
+        
+        to_upsert = []
+        count = 0
+        
+        for count, record in enumerate(records, 1):
+            existing_record = existing_by_key.get(
+                (record["age_category"], record["gender"], record["weight_class"])
+            )
             
-            if existing.data and len(existing.data) > 0:
-                # Record exists - check if update is needed
-                existing_record = existing.data[0]
-                record_id = existing_record["id"]
-                
-                # Compare values to see what changed
-                changes = {}
-                if existing_record.get("snatch_record") != record.get("snatch_record"):
-                    changes["snatch_record"] = {
-                        "old": existing_record.get("snatch_record"),
-                        "new": record.get("snatch_record")
-                    }
-                if existing_record.get("cj_record") != record.get("cj_record"):
-                    changes["cj_record"] = {
-                        "old": existing_record.get("cj_record"),
-                        "new": record.get("cj_record")
-                    }
-                if existing_record.get("total_record") != record.get("total_record"):
-                    changes["total_record"] = {
-                        "old": existing_record.get("total_record"),
-                        "new": record.get("total_record")
+            if existing_record is not None:
+                # Record exists - check if update is needed; most records are
+                # unchanged, so compare all lifts at once before building a diff
+                old_values = (
+                    existing_record.get("snatch_record"),
+                    existing_record.get("cj_record"),
+                    existing_record.get("total_record"),
+                )
+                new_values = (record["snatch_record"], record["cj_record"], record["total_record"])
+                if old_values != new_values:
+                    changes = {
+                        field: {"old": old, "new": new}
+                        for field, old, new in zip(_LIFT_FIELDS, old_values, new_values)
+                        if old != new
                     }
-                
-                if changes:
-                    # Update the record
-                    self.supabase_client.table("wso_records").update(record).eq("id", record_id).execute()
+                    
+                    # Queue the update
+                    to_upsert.append(record)
                     
                     # Track the update
                     self.changes["updated"].append({
@@ -258,8 +350,8 @@ class WSORecordsFlatScraper:
                     })
                     print(f"  ✓ Updated: {record['age_category']} {record['gender']} {record['weight_class']}")
             else:
-                # Record doesn't exist - insert it
-                self.supabase_client.table("wso_records").insert(record).execute()
+                # Record doesn't exist - queue it for insert
+                to_upsert.append(record)
                 
                 # Track the insertion
                 self.changes["inserted"].append({
@@ -272,6 +364,32 @@ class WSORecordsFlatScraper:
                     "total_record": record.get("total_record")
                 })
                 print(f"  ✓ Inserted: {record['age_category']} {record['gender']} {record['weight_class']}")
+        
+        # Nothing new or changed: skip the write side entirely
+        if not to_upsert:
+            print("  No changes")
+            return count
+        
+        # Write all inserts and updates in bulk, chunked to stay under payload limits.
+        # Batches hold disjoint keys, so several can be in flight at once.
+        batches = [
+            to_upsert[start:start + _UPSERT_BATCH_SIZE]
+            for start in range(0, len(to_upsert), _UPSERT_BATCH_SIZE)
+        ]
+        if len(batches) == 1:
+            self._upsert_batch(batches[0])
+        else:
+            with ThreadPoolExecutor(max_workers=min(len(batches), _MAX_UPSERT_WORKERS)) as executor:
+                list(executor.map(self._upsert_batch, batches))
+        
+        return count
+    
+    def _upsert_batch(self, batch: List[Dict[str, Any]]) -> None:
+        """Upsert one batch of records on (wso, age_category, gender, weight_class)."""
+        self.supabase_client.table("wso_records").upsert(
+            batch,
+            on_conflict="wso,age_category,gender,weight_class"
+        ).execute()
     
     def send_discord_notification(self) -> None:
         """Send Discord notification with change summary."""
@@ -283,9 +401,9 @@ class WSORecordsFlatScraper:
             embed = {
                 "title": f"📊 {self.wso_name} WSO Records - No Changes",
                 "description": "Scraper ran successfully. No new records or updates.",
-                "color": 5814783,  # Blue color
-                "timestamp": datetime.utcnow().isoformat(),
-                "footer": {"text": "WSO Records Scraper"}
+                "color": _COLOR_BLUE,
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "footer": _EMBED_FOOTER
             }
             payload = {"embeds": [embed]}
         else:
@@ -330,7 +448,7 @@ class WSORecordsFlatScraper:
                 for record in self.changes["updated"][:10]:  # Limit to 10
                     changes_str = []
                     for field, change in record["changes"].items():
-                        field_name = field.replace("_record", "").replace("cj", "C&J").title()
+                        field_name = _FIELD_LABELS.get(field, field)
                         old = f"{change['old']}kg" if change['old'] else "None"
                         new = f"{change['new']}kg" if change['new'] else "None"
                         changes_str.append(f"{field_name}: {old} → {new}")
@@ -351,16 +469,16 @@ class WSORecordsFlatScraper:
             embed = {
                 "title": f"📊 {self.wso_name} WSO Records Update",
                 "description": "\n".join(description_parts),
-                "color": 3066993,  # Green color
+                "color": _COLOR_GREEN,
                 "fields": fields,
-                "timestamp": datetime.utcnow().isoformat(),
-                "footer": {"text": "WSO Records Scraper"}
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "footer": _EMBED_FOOTER
             }
             payload = {"embeds": [embed]}
         
         # Send to Discord
         try:
-            response = requests.post(self.discord_webhook_url, json=payload)
+            response = self.http.post(self.discord_webhook_url, json=payload, timeout=_HTTP_TIMEOUT)
             response.raise_for_status()
             print("✓ Discord notification sent")
         except Exception as e:
@@ -375,14 +493,10 @@ class WSORecordsFlatScraper:
         self.setup_supabase_client()
         self.setup_discord()
         
-        # Scrape data
-        print("Scraping Google Sheet...")
-        records = self.scrape_sheet()
-        print(f"Found {len(records)} records")
-        
-        # Upsert to database
-        print("Upserting records to Supabase...")
-        self.upsert_records(records)
+        # Scrape data and stream it straight into the upsert
+        print("Scraping Google Sheet and upserting records to Supabase...")
+        count = self.upsert_records(self.iter_records())
+        print(f"Found {count} records")
         
         # Send notification
         print("Sending Discord notification...")
@@ -12,20 +12,85 @@ For New Jersey WSO which uses a unique side-by-side layout with:
 
 import os
 import sys
+import csv
+import io
 import json
 import argparse
+import functools
 import re
-from typing import List, Dict, Any, Optional
-from datetime import datetime
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Iterable, Optional, Tuple
+from datetime import datetime, timezone
 
 import requests
+from requests.adapters import HTTPAdapter
 from supabase import create_client, Client
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# Spreadsheet ID in a Google Sheets URL
+_SHEET_ID_RE = re.compile(r'/spreadsheets/d/([a-zA-Z0-9-_]+)')
+
+# Tab configuration as (tab name, gid) pairs, in scrape order
+# Based on the provided URLs
+_TABS = (
+    ("Senior", "0"),  # Open Records (all ages) - default tab
+    ("Junior", "336358523"),  # Junior Records (15-20)
+    ("U17", "2116279815"),  # 16-17 Youth Records
+    ("U15", "1466042495"),  # 14-15 Youth Records
+    ("U13", "1569406083"),  # Under 13 Youth Records
+    ("Masters 35", "575793496"),  # 35-39 Masters Records
+    ("Masters 40", "2006037821"),  # 40-44 Masters Records
+    ("Masters 45", "1977742090"),  # 45-49 Masters Records
+    ("Masters 50", "1673511438"),  # 50-54 Masters Records
+    ("Masters 55", "1894823432"),  # 55-59 Masters Records
+    ("Masters 60", "1933132040"),  # 60-64 Masters Records
+    ("Masters 65", "127836685"),  # 65-69 Masters Records
+    ("Masters 70", "239397826"),  # 70-74 Masters Records
+    ("Masters 75", "2047529058"),  # 75-79 Men/ 75+ Women Masters Records
+    ("Masters 80", "389932308"),  # 80+ Men's Masters Records
+)
+
+# Maximum number of tab CSVs fetched from Google Sheets at once
+_MAX_FETCH_WORKERS = 8
+
+# Timeout in seconds for Google Sheets and Discord requests
+_HTTP_TIMEOUT = 30
+
+# Lift fields on a record, in Snatch / C&J / Total order
+_LIFT_FIELDS = ("snatch_record", "cj_record", "total_record")
+
+# Display names for lift fields in Discord embeds
+_FIELD_LABELS = {"snatch_record": "Snatch", "cj_record": "C&J", "total_record": "Total"}
+
+# Columns needed to diff scraped records against the database
+_RECORD_COLUMNS = "wso,age_category,gender,weight_class,snatch_record,cj_record,total_record"
+
+# Maximum number of rows sent to Supabase in a single upsert request
+_UPSERT_BATCH_SIZE = 500
+
+
+@functools.lru_cache(maxsize=1)
+def _get_http_session() -> requests.Session:
+    """
+    Create an HTTP session whose connection pool covers every fetch worker.
+    
+    Cached so scrapers constructed in the same process share warm connections.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=_MAX_FETCH_WORKERS, pool_maxsize=_MAX_FETCH_WORKERS)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@functools.lru_cache(maxsize=4)
+def _get_supabase_client(supabase_url: str, supabase_key: str) -> Client:
+    """Create a Supabase client, cached per (url, key) for the life of the process."""
+    return create_client(supabase_url, supabase_key)
+
 
 class WSORecordsNewJerseyScraper:
     """Scraper for New Jersey WSO weightlifting records with unique side-by-side layout."""
@@ -37,27 +102,11 @@ class WSORecordsNewJerseyScraper:
         self.changes = {"inserted": [], "updated": []}
         
         # Tab configuration (gid mapping)
-        # Based on the provided URLs
-        self.tabs = {
-            "Senior": "0",  # Open Records (all ages) - default tab
-            "Junior": "336358523",  # Junior Records (15-20)
-            "U17": "2116279815",  # 16-17 Youth Records
-            "U15": "1466042495",  # 14-15 Youth Records
-            "U13": "1569406083",  # Under 13 Youth Records
-            "Masters 35": "575793496",  # 35-39 Masters Records
-            "Masters 40": "2006037821",  # 40-44 Masters Records
-            "Masters 45": "1977742090",  # 45-49 Masters Records
-            "Masters 50": "1673511438",  # 50-54 Masters Records
-            "Masters 55": "1894823432",  # 55-59 Masters Records
-            "Masters 60": "1933132040",  # 60-64 Masters Records
-            "Masters 65": "127836685",  # 65-69 Masters Records
-            "Masters 70": "239397826",  # 70-74 Masters Records
-            "Masters 75": "2047529058",  # 75-79 Men/ 75+ Women Masters Records
-            "Masters 80": "389932308",  # 80+ Men's Masters Records
-        }
+        self.tabs = _TABS
         
         self.supabase_client = None
         self.discord_webhook_url = None
+        self.http = _get_http_session()
         
     def setup_supabase_client(self):
         """Set up Supabase client."""
@@ -67,7 +116,7 @@ class WSORecordsNewJerseyScraper:
         if not supabase_url or not supabase_key:
             raise ValueError("SUPABASE_URL and SUPABASE_KEY environment variables must be set")
         
-        self.supabase_client: Client = create_client(supabase_url, supabase_key)
+        self.supabase_client: Client = _get_supabase_client(supabase_url, supabase_key)
         print("✓ Supabase client initialized")
     
     def setup_discord(self):
@@ -91,15 +140,25 @@ class WSORecordsNewJerseyScraper:
         sheet_id = self._extract_sheet_id(self.sheet_url)
         all_records = []
         
-        # Scrape each tab
-        for tab_name, gid in self.tabs.items():
+        tabs = []
+        for tab_name, gid in self.tabs:
             if gid is None:
                 print(f"⚠️  Skipping {tab_name} - gid not configured")
                 continue
-                
+            tabs.append((tab_name, gid))
+        
+        # Fetch and parse all tabs concurrently over one pooled session
+        # (network-bound), then collect the results in tab order
+        with ThreadPoolExecutor(max_workers=_MAX_FETCH_WORKERS) as executor:
+            futures = [
+                executor.submit(self._scrape_tab, sheet_id, gid, tab_name)
+                for tab_name, gid in tabs
+            ]
+        
+        for (tab_name, _), future in zip(tabs, futures):
             print(f"\nScraping {tab_name} tab...")
             try:
-                records = self._scrape_tab(sheet_id, gid, tab_name)
+                records = future.result()
                 all_records.extend(records)
                 print(f"✓ Found {len(records)} records in {tab_name}")
             except Exception as e:
@@ -107,40 +166,38 @@ class WSORecordsNewJerseyScraper:
                 import traceback
                 traceback.print_exc()
         
-        # Consolidate duplicate weight class records
-        consolidated_records = self._consolidate_records(all_records)
-        if len(consolidated_records) != len(all_records):
-            print(f"\n✓ Consolidated {len(all_records)} records into {len(consolidated_records)} (merged duplicates)")
-        
-        return consolidated_records
+        return all_records
     
     def _extract_sheet_id(self, url: str) -> str:
         """Extract sheet ID from URL."""
-        match = re.search(r'/spreadsheets/d/([a-zA-Z0-9-_]+)', url)
+        match = _SHEET_ID_RE.search(url)
         if not match:
             raise ValueError("Invalid Google Sheets URL")
         return match.group(1)
     
     def _scrape_tab(self, sheet_id: str, gid: str, tab_name: str) -> List[Dict[str, Any]]:
         """Scrape a single tab."""
+        return self._parse_tab(self._fetch_tab_csv(sheet_id, gid), tab_name)
+    
+    def _fetch_tab_csv(self, sheet_id: str, gid: str) -> str:
+        """Fetch a single tab as CSV text."""
         csv_url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&gid={gid}"
-        response = requests.get(csv_url)
+        response = self.http.get(csv_url, timeout=_HTTP_TIMEOUT)
         
         if response.status_code != 200:
             raise Exception(f"Failed to fetch tab: {response.status_code}")
         
-        # Parse CSV
-        import csv
-        import io
-        csv_reader = csv.reader(io.StringIO(response.text))
-        rows = list(csv_reader)
-        
-        # Parse the side-by-side layout
-        records = self._parse_side_by_side(rows, tab_name)
+        return response.text
+    
+    def _parse_tab(self, csv_text: str, tab_name: str) -> List[Dict[str, Any]]:
+        """Parse a single tab's CSV text."""
+        # Parse CSV rows lazily straight into the side-by-side layout parser
+        csv_reader = csv.reader(io.StringIO(csv_text))
+        records = self._parse_side_by_side(csv_reader, tab_name)
         
         return records
     
-    def _parse_side_by_side(self, rows: List[List[str]], tab_name: str) -> List[Dict[str, Any]]:
+    def _parse_side_by_side(self, row_iter: Iterable[List[str]], tab_name: str) -> List[Dict[str, Any]]:
         """
         Parse New Jersey's unique side-by-side layout.
         
@@ -153,8 +210,10 @@ class WSORecordsNewJerseyScraper:
         - Men: 8 (weight), 9 (athlete), 10 (date), 11 (snatch), 12 (c&j), 13 (total)
         
         Special case: Masters 80 tab only has men's records in the left columns.
+        
+        Duplicate weight classes within the tab are merged as they are parsed.
         """
-        records = []
+        records = {}
         age_category = self._map_age_category(tab_name)
         
         # Track last weight classes for handling + categories
@@ -164,22 +223,22 @@ class WSORecordsNewJerseyScraper:
         # Masters 80 is men-only, data is in left columns but should be treated as men
         is_masters_80 = tab_name == "Masters 80"
         
-        for i, row in enumerate(rows):
+        # Skip the first row (header)
+        row_iter = iter(row_iter)
+        next(row_iter, None)
+        
+        for row in row_iter:
             # Skip empty rows or header rows
             if not row or len(row) < 14:
                 continue
             
-            # Skip the first row (header)
-            if i == 0:
-                continue
-            
             if is_masters_80:
                 # For Masters 80, left columns are men's records
                 men_record = self._parse_single_side(
                     row, 1, "Men", age_category, last_men_weight
                 )
                 if men_record:
-                    records.append(men_record)
+                    self._merge_record(records, men_record)
                     if men_record['weight_class'] and not men_record['weight_class'].endswith('+'):
                         last_men_weight = men_record['weight_class']
             else:
@@ -189,7 +248,7 @@ class WSORecordsNewJerseyScraper:
                     row, 1, "Women", age_category, last_women_weight
                 )
                 if women_record:
-                    records.append(women_record)
+                    self._merge_record(records, women_record)
                     # Update last weight class if it's not a + category and not empty
                     if women_record['weight_class'] and not women_record['weight_class'].endswith('+'):
                         last_women_weight = women_record['weight_class']
@@ -199,12 +258,12 @@ class WSORecordsNewJerseyScraper:
                     row, 8, "Men", age_category, last_men_weight
                 )
                 if men_record:
-                    records.append(men_record)
+                    self._merge_record(records, men_record)
                     # Update last weight class if it's not a + category and not empty
                     if men_record['weight_class'] and not men_record['weight_class'].endswith('+'):
                         last_men_weight = men_record['weight_class']
         
-        return records
+        return list(records.values())
     
     def _parse_single_side(self, row: List[str], col_offset: int, gender: str, 
                           age_category: str, last_weight: Optional[str] = None) -> Optional[Dict[str, Any]]:
@@ -219,27 +278,27 @@ class WSORecordsNewJerseyScraper:
         4: clean and jerk
         5: total
         """
-        # Get weight class from first column
-        weight_class = row[col_offset].strip() if len(row) > col_offset else ""
+        # The caller only passes rows with all 14 columns, so both sides are complete
+        weight_class, athlete, _date, snatch_val, cj_val, total_val = row[col_offset:col_offset + 6]
+        weight_class = weight_class.strip()
+        snatch_val = snatch_val.strip()
+        cj_val = cj_val.strip()
+        total_val = total_val.strip()
         
         # Handle + category (empty weight class)
-        if not weight_class or weight_class == "":
+        if not weight_class:
+            # A side with no athlete or lifts either is padding, not a + category
+            if not (snatch_val or cj_val or total_val or athlete.strip()):
+                return None
             if last_weight:
                 weight_class = last_weight + "+"
             else:
                 return None
         
-        # Get athlete name
-        athlete = row[col_offset + 1].strip() if len(row) > col_offset + 1 else ""
-        
-        # Get lift values
-        snatch_val = row[col_offset + 3].strip() if len(row) > col_offset + 3 else ""
-        cj_val = row[col_offset + 4].strip() if len(row) > col_offset + 4 else ""
-        total_val = row[col_offset + 5].strip() if len(row) > col_offset + 5 else ""
-        
-        snatch = self._parse_int(snatch_val)
-        cj = self._parse_int(cj_val)
-        total = self._parse_int(total_val)
+        parse_int = self._parse_int
+        snatch = parse_int(snatch_val)
+        cj = parse_int(cj_val)
+        total = parse_int(total_val)
         
         # Create record even if athlete is "Vacant" or empty - this shows which weight classes exist
         # The NULL values indicate no records have been set yet
@@ -253,20 +312,27 @@ class WSORecordsNewJerseyScraper:
             'total_record': total
         }
     
-    def _parse_int(self, value: str) -> Optional[int]:
+    @staticmethod
+    def _parse_int(value: str) -> Optional[int]:
         """Parse integer value, return None if invalid or 0."""
-        if not value or value == "":
-            return None
-        try:
-            parsed = int(float(value))
-            # Convert 0 to None (empty records)
-            return None if parsed == 0 else parsed
-        except ValueError:
+        if not value:
             return None
+        # Fast path: plain digit strings skip the float() round-trip
+        if value.isdecimal():
+            parsed = int(value)
+        else:
+            try:
+                parsed = int(float(value))
+            except ValueError:
+                return None
+        # Convert 0 to None (empty records)
+        return parsed or None
     
-    def _consolidate_records(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _merge_record(records: Dict[Tuple[str, str], Dict[str, Any]], record: Dict[str, Any]) -> None:
         """
-        Consolidate duplicate weight class records by taking the best (non-null) value for each lift.
+        Add a record to a tab's records, merging duplicate weight classes by taking the best
+        (non-null) value for each lift.
         
         This handles cases where multiple athletes have partial records for the same weight class.
         For example:
@@ -275,64 +341,44 @@ class WSORecordsNewJerseyScraper:
         
         Result: 71kg Men - Snatch: 90, C&J: 117, Total: 203
         """
-        from collections import defaultdict
-        
-        # Group records by (wso, age_category, gender, weight_class)
-        grouped = defaultdict(list)
-        for record in records:
-            key = (
-                record['wso'],
-                record['age_category'],
-                record['gender'],
-                record['weight_class']
-            )
-            grouped[key].append(record)
-        
-        # Consolidate each group
-        consolidated = []
-        for key, group_records in grouped.items():
-            if len(group_records) == 1:
-                # No duplicates, use as-is
-                consolidated.append(group_records[0])
-            else:
-                # Merge duplicates - take the best (max) value for each lift
-                merged = {
-                    'wso': key[0],
-                    'age_category': key[1],
-                    'gender': key[2],
-                    'weight_class': key[3],
-                    'snatch_record': None,
-                    'cj_record': None,
-                    'total_record': None
-                }
-                
-                # For each lift, take the non-null value (or max if multiple non-null)
-                snatch_values = [r['snatch_record'] for r in group_records if r['snatch_record'] is not None]
-                cj_values = [r['cj_record'] for r in group_records if r['cj_record'] is not None]
-                total_values = [r['total_record'] for r in group_records if r['total_record'] is not None]
-                
-                merged['snatch_record'] = max(snatch_values) if snatch_values else None
-                merged['cj_record'] = max(cj_values) if cj_values else None
-                merged['total_record'] = max(total_values) if total_values else None
-                
-                consolidated.append(merged)
-        
-        return consolidated
+        # Each tab is its own age category, so (gender, weight_class) identifies a record
+        key = (record['gender'], record['weight_class'])
+        current = records.get(key)
+        if current is None:
+            records[key] = record
+            return
+        
+        # For each lift, keep the non-null value (or max if multiple non-null)
+        for field in _LIFT_FIELDS:
+            value = record[field]
+            if value is not None and (current[field] is None or value > current[field]):
+                current[field] = value
+    
+    def _load_existing_index(self) -> Dict[Tuple[str, str, str, str], Dict[str, Any]]:
+        """Fetch this WSO's existing records in one query, keyed by (wso, age_category, gender, weight_class)."""
+        existing = self.supabase_client.table("wso_records").select(_RECORD_COLUMNS).eq("wso", self.wso_name).execute()
+        return {
+            (row["wso"], row["age_category"], row["gender"], row["weight_class"]): row
+            for row in existing.data
+        }
     
     def upsert_records(self, records: List[Dict[str, Any]]) -> None:
-        """Upsert records to Supabase."""
+        """
+        Upsert records to Supabase.
+        
+        Diffs against the WSO's existing records in memory, then writes all new
+        and changed records with bulk upserts on
+        (wso, age_category, gender, weight_class).
+        """
+        existing_by_key = self._load_existing_index()
+        to_upsert = []
+        
         for record in records:
-            existing = self.supabase_client.table("wso_records").select("*").match({
-                "wso": record["wso"],
-                "age_category": record["age_category"],
-                "gender": record["gender"],
-                "weight_class": record["weight_class"]
-            }).execute()
+            existing_record = existing_by_key.get(
+                (record["wso"], record["age_category"], record["gender"], record["weight_class"])
+            )
             
-            if existing.data and len(existing.data) > 0:
-                existing_record = existing.data[0]
-                record_id = existing_record["id"]
-                
+            if existing_record is not None:
                 changes = {}
                 if existing_record.get("snatch_record") != record.get("snatch_record"):
                     changes["snatch_record"] = {
@@ -351,7 +397,7 @@ class WSORecordsNewJerseyScraper:
                     }
                 
                 if changes:
-                    self.supabase_client.table("wso_records").update(record).eq("id", record_id).execute()
+                    to_upsert.append(record)
                     self.changes["updated"].append({
                         "wso": record["wso"],
                         "age_category": record["age_category"],
@@ -361,7 +407,7 @@ class WSORecordsNewJerseyScraper:
                     })
                     print(f"  ✓ Updated: {record['age_category']} {record['gender']} {record['weight_class']}")
             else:
-                self.supabase_client.table("wso_records").insert(record).execute()
+                to_upsert.append(record)
                 self.changes["inserted"].append({
                     "wso": record["wso"],
                     "age_category": record["age_category"],
@@ -372,6 +418,13 @@ class WSORecordsNewJerseyScraper:
                     "total_record": record.get("total_record")
                 })
                 print(f"  ✓ Inserted: {record['age_category']} {record['gender']} {record['weight_class']}")
+        
+        # Write all inserts and updates in bulk, chunked to stay under payload limits
+        for start in range(0, len(to_upsert), _UPSERT_BATCH_SIZE):
+            self.supabase_client.table("wso_records").upsert(
+                to_upsert[start:start + _UPSERT_BATCH_SIZE],
+                on_conflict="wso,age_category,gender,weight_class"
+            ).execute()
     
     def send_discord_notification(self) -> None:
         """Send Discord notification."""
@@ -383,7 +436,7 @@ class WSORecordsNewJerseyScraper:
                 "title": f"📊 {self.wso_name} WSO Records - No Changes",
                 "description": "Scraper ran successfully. No new records or updates.",
                 "color": 3447003,
-                "timestamp": datetime.now(datetime.UTC).isoformat() if hasattr(datetime, 'UTC') else datetime.utcnow().isoformat(),
+                "timestamp": datetime.now(timezone.utc).isoformat(),
                 "footer": {"text": "WSO Records Scraper"}
             }
             payload = {"embeds": [embed]}
@@ -397,50 +450,42 @@ class WSORecordsNewJerseyScraper:
             fields = []
             
             if total_inserted > 0:
-                inserted_text = []
-                for record in self.changes["inserted"][:10]:
-                    lifts = []
-                    if record.get("snatch_record"):
-                        lifts.append(f"Snatch: {record['snatch_record']}kg")
-                    if record.get("cj_record"):
-                        lifts.append(f"C&J: {record['cj_record']}kg")
-                    if record.get("total_record"):
-                        lifts.append(f"Total: {record['total_record']}kg")
-                    
-                    lifts_str = ", ".join(lifts) if lifts else "No records"
-                    inserted_text.append(
-                        f"• **{record['age_category']}** | {record['gender']} | {record['weight_class']}\n  {lifts_str}"
-                    )
+                def format_inserted(record: Dict[str, Any]) -> str:
+                    lifts_str = ", ".join(
+                        f"{label}: {record[field]}kg"
+                        for field, label in _FIELD_LABELS.items() if record.get(field)
+                    ) or "No records"
+                    return f"• **{record['age_category']}** | {record['gender']} | {record['weight_class']}\n  {lifts_str}"
                 
+                inserted_text = "\n".join(map(format_inserted, self.changes["inserted"][:10]))
                 if total_inserted > 10:
-                    inserted_text.append(f"_...and {total_inserted - 10} more_")
+                    inserted_text += f"\n_...and {total_inserted - 10} more_"
                 
                 fields.append({
                     "name": "🆕 New Records",
-                    "value": "\n".join(inserted_text),
+                    "value": inserted_text,
                     "inline": False
                 })
             
             if total_updated > 0:
-                updated_text = []
-                for record in self.changes["updated"][:10]:
-                    changes_str = []
-                    for field, change in record["changes"].items():
-                        field_name = field.replace("_record", "").replace("cj", "C&J").title()
-                        old = f"{change['old']}kg" if change['old'] else "None"
-                        new = f"{change['new']}kg" if change['new'] else "None"
-                        changes_str.append(f"{field_name}: {old} → {new}")
-                    
-                    updated_text.append(
-                        f"• **{record['age_category']}** | {record['gender']} | {record['weight_class']}\n  {', '.join(changes_str)}"
+                def format_change(field: str, change: Dict[str, Any]) -> str:
+                    old = f"{change['old']}kg" if change['old'] else "None"
+                    new = f"{change['new']}kg" if change['new'] else "None"
+                    return f"{_FIELD_LABELS[field]}: {old} → {new}"
+                
+                def format_updated(record: Dict[str, Any]) -> str:
+                    changes_str = ", ".join(
+                        format_change(field, change) for field, change in record["changes"].items()
                     )
+                    return f"• **{record['age_category']}** | {record['gender']} | {record['weight_class']}\n  {changes_str}"
                 
+                updated_text = "\n".join(map(format_updated, self.changes["updated"][:10]))
                 if total_updated > 10:
-                    updated_text.append(f"_...and {total_updated - 10} more_")
+                    updated_text += f"\n_...and {total_updated - 10} more_"
                 
                 fields.append({
                     "name": "📝 Updated Records",
-                    "value": "\n".join(updated_text),
+                    "value": updated_text,
                     "inline": False
                 })
             
@@ -449,13 +494,13 @@ class WSORecordsNewJerseyScraper:
                 "description": "\n".join(description_parts),
                 "color": 3066993,
                 "fields": fields,
-                "timestamp": datetime.now(datetime.UTC).isoformat() if hasattr(datetime, 'UTC') else datetime.utcnow().isoformat(),
+                "timestamp": datetime.now(timezone.utc).isoformat(),
                 "footer": {"text": "WSO Records Scraper"}
             }
             payload = {"embeds": [embed]}
         
         try:
-            response = requests.post(self.discord_webhook_url, json=payload)
+            response = self.http.post(self.discord_webhook_url, json=payload, timeout=_HTTP_TIMEOUT)
             response.raise_for_status()
             print("✓ Discord notification sent")
         except Exception as e:
@@ -494,25 +539,20 @@ class WSORecordsNewJerseyScraper:
         to_insert = []
         to_update = []
         
+        existing_by_key = self._load_existing_index()
+        
         for record in scraped_records:
             # Check if record exists in database
-            existing = self.supabase_client.table("wso_records").select("*").eq(
-                "wso", record["wso"]
-            ).eq(
-                "age_category", record["age_category"]
-            ).eq(
-                "gender", record["gender"]
-            ).eq(
-                "weight_class", record["weight_class"]
-            ).execute()
+            db_record = existing_by_key.get(
+                (record["wso"], record["age_category"], record["gender"], record["weight_class"])
+            )
             
-            if existing.data:
+            if db_record is not None:
                 # Record exists, check if values changed
-                db_record = existing.data[0]
                 changed = False
                 changes = []
                 
-                for field in ["snatch_record", "cj_record", "total_record"]:
+                for field in _LIFT_FIELDS:
                     db_val = db_record.get(field)
                     new_val = record.get(field)
                     if db_val != new_val:
@@ -8,64 +8,165 @@ Sends Discord notifications for changes.
 
 import os
 import sys
+import csv
+import io
 import json
 import argparse
+import functools
 import re
-from typing import List, Dict, Any, Tuple
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Iterable, Optional, Tuple
+from datetime import datetime, timezone
+from urllib.parse import quote
 
 import gspread
 from google.oauth2.service_account import Credentials
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from supabase import create_client, Client
+from postgrest.types import ReturnMethod
+
+
+# Maximum number of rows sent to Supabase in a single upsert request
+_UPSERT_BATCH_SIZE = 500
+
+# Maximum number of tab CSVs fetched from Google Sheets at once
+_MAX_FETCH_WORKERS = 8
+
+# (connect, read) timeouts in seconds for Google Sheets and Discord requests
+_HTTP_TIMEOUT = (5, 30)
+
+# Age ranges such as "35 - 39" or "14-15" in merged header rows
+_AGE_RANGE_RE = re.compile(r'(\d+)\s*-\s*(\d+)')
+
+# Weight class such as "36 kg" in merged header rows
+_KG_RE = re.compile(r'(\d+)\s*kg', re.IGNORECASE)
+
+# Age categories and genders looked for in tab names, in priority order;
+# "Women" must come first since "Men" is a substring of it
+_TAB_AGE_CATEGORIES = ("Youth", "Junior", "Senior", "Masters")
+_TAB_GENDERS = ("Women", "Men")
+
+# Age categories without subdivisions inside their tabs
+_UNDIVIDED_AGE_CATEGORIES = frozenset({"Junior", "Senior"})
+
+# First-column values of header rows that carry no data
+_HEADER_ROWS = frozenset({"lift", "athlete", "team", "weight", "date", "meet", "location"})
+
+# First-column values of lift rows, mapped to the lift they hold
+_LIFT_KINDS = {
+    "snatch": "snatch",
+    "clean & jerk": "cj",
+    "clean and jerk": "cj",
+    "c&j": "cj",
+    "total": "total",
+}
+
+# Lift columns compared when diffing against existing records
+_LIFT_FIELDS = ("snatch_record", "cj_record", "total_record")
+
+# Discord embed constants
+_DISCORD_MAX_LISTED = 10  # Records listed per field, to avoid message size issues
+_RECORD_LINE = "• **{age_category}** | {gender} | {weight_class}\n  {detail}"
+_LIFT_LABELS = {"snatch_record": "Snatch", "cj_record": "C&J", "total_record": "Total"}
+_COLOR_BLUE = 5814783
+_COLOR_GREEN = 3066993
+_EMBED_FOOTER = {"text": "WSO Records Scraper"}
+
+
+def _create_http_session() -> requests.Session:
+    """Create a pooled HTTP session with retry/backoff on transient errors."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _sheet_range(tab_name: str) -> str:
+    """A1-notation range covering a whole tab, quoted for names with spaces."""
+    return "'{}'".format(tab_name.replace("'", "''"))
+
+
+@functools.lru_cache(maxsize=1)
+def _get_google_client() -> Optional[gspread.Client]:
+    """
+    Build an authorized gspread client from GOOGLE_SERVICE_ACCOUNT_JSON.
+    
+    Cached so the credentials are parsed and exchanged once per process.
+    Returns None when no service account is configured.
+    """
+    service_account_json = os.getenv("GOOGLE_SERVICE_ACCOUNT_JSON")
+    if not service_account_json:
+        return None
+    
+    service_account_info = json.loads(service_account_json)
+    scopes = [
+        "https://www.googleapis.com/auth/spreadsheets.readonly",
+        "https://www.googleapis.com/auth/drive.readonly"
+    ]
+    credentials = Credentials.from_service_account_info(
+        service_account_info, scopes=scopes
+    )
+    return gspread.authorize(credentials)
 
 
 class WSORecordsScraper:
     """Scraper for WSO weightlifting records."""
     
-    def __init__(self, wso_name: str, sheet_url: str):
-        """Initialize the scraper with WSO name and sheet URL."""
+    def __init__(self, wso_name: str, sheet_url: str,
+                 supabase_client: Optional[Client] = None,
+                 http: Optional[requests.Session] = None):
+        """
+        Initialize the scraper with WSO name and sheet URL.
+        
+        An existing Supabase client and HTTP session can be passed in to share
+        connections across several WSOs scraped in one process.
+        """
         self.wso_name = wso_name
         self.sheet_url = sheet_url
         self.changes = {"inserted": [], "updated": []}
         
         # Initialize clients
         self.google_client = None
-        self.supabase_client = None
+        self.google_api_key = None
+        self.supabase_client = supabase_client
         self.discord_webhook_url = None
         
+        # Shared HTTP session so Google and Discord requests reuse connections
+        self.http = http if http is not None else _create_http_session()
+        
     def setup_google_client(self):
         """Set up Google Sheets client with service account or anonymous access."""
-        service_account_json = os.getenv("GOOGLE_SERVICE_ACCOUNT_JSON")
+        self.google_client = _get_google_client()
         
-        if service_account_json:
+        if self.google_client is not None:
             # Use service account if provided
-            service_account_info = json.loads(service_account_json)
-            scopes = [
-                "https://www.googleapis.com/auth/spreadsheets.readonly",
-                "https://www.googleapis.com/auth/drive.readonly"
-            ]
-            credentials = Credentials.from_service_account_info(
-                service_account_info, scopes=scopes
-            )
-            self.google_client = gspread.authorize(credentials)
             self.use_public_api = False
             print("✓ Google Sheets client initialized (authenticated)")
         else:
             # Use public API for public sheets
-            self.google_client = None
             self.use_public_api = True
             print("✓ Using public Google Sheets API (no authentication)")
+        
+        # Optional API key lets public sheets be read as JSON via Sheets API v4
+        self.google_api_key = os.getenv("GOOGLE_API_KEY") or None
     
     def setup_supabase_client(self):
         """Set up Supabase client."""
-        supabase_url = os.getenv("SUPABASE_URL")
-        supabase_key = os.getenv("SUPABASE_KEY")
-        
-        if not supabase_url or not supabase_key:
-            raise ValueError("SUPABASE_URL and SUPABASE_KEY environment variables must be set")
-        
-        self.supabase_client: Client = create_client(supabase_url, supabase_key)
+        if self.supabase_client is None:
+            supabase_url = os.getenv("SUPABASE_URL")
+            supabase_key = os.getenv("SUPABASE_KEY")
+            
+            if not supabase_url or not supabase_key:
+                raise ValueError("SUPABASE_URL and SUPABASE_KEY environment variables must be set")
+            
+            self.supabase_client: Client = create_client(supabase_url, supabase_key)
         print("✓ Supabase client initialized")
     
     def setup_discord(self):
@@ -106,14 +207,10 @@ class WSORecordsScraper:
         # Open the spreadsheet
         spreadsheet = self.google_client.open_by_key(sheet_id)
         
-        # Get all worksheets (tabs)
-        worksheets = spreadsheet.worksheets()
-        
-        all_records = []
-        
         # Tab names typically follow pattern: "Youth Women", "Youth Men", etc.
-        # Parse each tab
-        for worksheet in worksheets:
+        # Work out which tabs to parse before fetching any cell data
+        tabs = []
+        for worksheet in spreadsheet.worksheets():
             tab_name = worksheet.title
             print(f"  Processing tab: {tab_name}")
             
@@ -122,13 +219,22 @@ class WSORecordsScraper:
             if not age_category or not gender:
                 continue
             
-            # Get worksheet data
-            all_values = worksheet.get_all_values()
-            
+            tabs.append((tab_name, age_category, gender))
+        
+        if not tabs:
+            return []
+        
+        # Fetch every tab's values in a single batchGet request
+        ranges = [_sheet_range(tab_name) for tab_name, _, _ in tabs]
+        value_ranges = spreadsheet.values_batch_get(ranges).get("valueRanges", [])
+        
+        all_records = []
+        
+        for (tab_name, age_category, gender), value_range in zip(tabs, value_ranges):
             # Parse the tab data
-            records = self._parse_tab_data(all_values, age_category, gender)
+            records = self._parse_tab_data(value_range.get("values", []), age_category, gender)
             all_records.extend(records)
-            print(f"    Found {len(records)} records")
+            print(f"    {tab_name}: found {len(records)} records")
         
         return all_records
     
@@ -146,31 +252,35 @@ class WSORecordsScraper:
             "Masters Women", "Masters Men"
         ]
         
-        all_records = []
-        
+        tabs = []
         for tab_name in tab_names:
-            print(f"  Trying tab: {tab_name}")
-            
             # Parse age category and gender from tab name
             age_category, gender = self._parse_tab_name(tab_name)
             if not age_category or not gender:
                 continue
+            tabs.append((tab_name, age_category, gender))
+        
+        if not tabs:
+            return []
+        
+        # Fetch all tabs concurrently; each request is network-bound
+        with ThreadPoolExecutor(max_workers=min(len(tabs), _MAX_FETCH_WORKERS)) as executor:
+            futures = [
+                executor.submit(self._fetch_tab_rows, sheet_id, tab_name)
+                for tab_name, _, _ in tabs
+            ]
+        
+        all_records = []
+        
+        for (tab_name, age_category, gender), future in zip(tabs, futures):
+            print(f"  Trying tab: {tab_name}")
             
-            # Fetch data from public API
             try:
-                # Use CSV export for public sheets
-                csv_url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={tab_name}"
-                response = requests.get(csv_url)
+                rows = future.result()
                 
-                if response.status_code == 200:
-                    # Parse CSV data
-                    import csv
-                    import io
-                    csv_data = csv.reader(io.StringIO(response.text))
-                    all_values = list(csv_data)
-                    
+                if rows is not None:
                     # Parse the tab data
-                    records = self._parse_tab_data(all_values, age_category, gender)
+                    records = self._parse_tab_data(rows, age_category, gender)
                     all_records.extend(records)
                     print(f"    Found {len(records)} records")
                 else:
@@ -180,37 +290,52 @@ class WSORecordsScraper:
         
         return all_records
     
+    def _fetch_tab_rows(self, sheet_id: str, tab_name: str) -> Optional[Iterable[List[str]]]:
+        """Fetch a tab's rows of cell values, or None if it is not accessible."""
+        if self.google_api_key:
+            # Sheets API v4 returns the values as JSON, so no CSV parsing is needed
+            values_url = (
+                f"https://sheets.googleapis.com/v4/spreadsheets/{sheet_id}"
+                f"/values/{quote(_sheet_range(tab_name), safe='')}"
+            )
+            response = self.http.get(values_url, params={"key": self.google_api_key}, timeout=_HTTP_TIMEOUT)
+            
+            if response.status_code != 200:
+                return None
+            return response.json().get("values", [])
+        
+        # Otherwise use CSV export for public sheets
+        csv_url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={tab_name}"
+        response = self.http.get(csv_url, timeout=_HTTP_TIMEOUT)
+        
+        if response.status_code != 200:
+            return None
+        
+        # Sheets exports CSV as UTF-8; decoding directly skips requests'
+        # charset detection over the whole body
+        return csv.reader(io.StringIO(response.content.decode("utf-8")))
+    
     def _parse_tab_name(self, tab_name: str) -> Tuple[str, str]:
         """Parse age category and gender from tab name."""
         # Examples: "Youth Women", "Youth Men", "Junior Women", "Masters Men"
-        if "Youth" in tab_name:
-            age_category = "Youth"
-        elif "Junior" in tab_name:
-            age_category = "Junior"
-        elif "Senior" in tab_name:
-            age_category = "Senior"
-        elif "Masters" in tab_name:
-            age_category = "Masters"
-        else:
+        age_category = next((age for age in _TAB_AGE_CATEGORIES if age in tab_name), None)
+        if age_category is None:
             print(f"    Skipping unknown tab: {tab_name}")
             return None, None
         
-        if "Women" in tab_name:
-            gender = "Women"
-        elif "Men" in tab_name:
-            gender = "Men"
-        else:
+        gender = next((gender for gender in _TAB_GENDERS if gender in tab_name), None)
+        if gender is None:
             print(f"    Skipping tab with unknown gender: {tab_name}")
             return None, None
         
         return age_category, gender
     
-    def _parse_tab_data(self, all_values: List[List[str]], age_category: str, gender: str) -> List[Dict[str, Any]]:
+    def _parse_tab_data(self, all_values: Iterable[List[str]], age_category: str, gender: str) -> List[Dict[str, Any]]:
         """
         Parse worksheet tab data.
         
         Args:
-            all_values: 2D list of cell values from worksheet
+            all_values: Rows of cell values from worksheet, consumed once in order
             age_category: Age category (e.g., "Youth", "Junior", "Senior")
             gender: Gender (e.g., "Women")
         
@@ -222,7 +347,7 @@ class WSORecordsScraper:
         seen_combinations = set()  # Track age_subdivision + weight_class to avoid duplicates
         
         # For Junior and Senior, use the category name directly since they don't have subdivisions
-        if age_category in ["Junior", "Senior"]:
+        if age_category in _UNDIVIDED_AGE_CATEGORIES:
             current_age_subdivision = age_category
         else:
             current_age_subdivision = None
@@ -296,23 +421,25 @@ class WSORecordsScraper:
         
         # Process all rows starting from row 0 to catch everything
         for i, row in enumerate(all_values):
-            if not row or len(row) == 0:
+            if not row:
                 continue
             
-            first_col = row[0].strip() if len(row) > 0 else ""
-            second_col = row[1].strip() if len(row) > 1 else ""
+            first_col = row[0].strip()
             
-            if not first_col:
+            # Bare numbers in column A never start a lift, weight class or age subdivision
+            if not first_col or first_col.isdigit():
                 continue
             
+            first_col_lower = first_col.lower()
+            
             # Handle special case: first row with merged header
             # Examples: "Ohio WSO... Lift 13 and Under 36 kg" or "... Lift 35 - 39 48 kg"
-            if i == 0 and "lift" in first_col.lower():
+            if i == 0 and "lift" in first_col_lower:
                 # Try to extract age subdivision and weight class from first row
                 
                 # Check for "X and under" pattern
-                if "and under" in first_col.lower():
-                    parts = first_col.lower().split("and under")
+                if "and under" in first_col_lower:
+                    parts = first_col_lower.split("and under")
                     if len(parts) >= 1:
                         words = parts[0].strip().split()
                         for word in reversed(words):
@@ -321,7 +448,7 @@ class WSORecordsScraper:
                                 break
                 
                 # Check for age range patterns like "35 - 39" or "14-15"
-                age_range_match = re.search(r'(\d+)\s*-\s*(\d+)', first_col)
+                age_range_match = _AGE_RANGE_RE.search(first_col)
                 if age_range_match:
                     lower_age = age_range_match.group(1)
                     upper_age = age_range_match.group(2)
@@ -335,8 +462,8 @@ class WSORecordsScraper:
                         current_age_subdivision = f"U{upper_age}"
                 
                 # Extract weight class if present (number before "kg")
-                if "kg" in first_col.lower():
-                    kg_match = re.search(r'(\d+)\s*kg', first_col.lower())
+                if "kg" in first_col_lower:
+                    kg_match = _KG_RE.search(first_col_lower)
                     if kg_match:
                         weight_num = kg_match.group(1)
                         current_weight_class = weight_num  # Store without " kg" to match database
@@ -344,27 +471,21 @@ class WSORecordsScraper:
                 continue
             
             # Skip obvious header rows
-            if first_col.lower() in ["lift", "athlete", "team", "weight", "date", "meet", "location"]:
+            if first_col_lower in _HEADER_ROWS:
                 continue
             
             # Check if this is a lift row (Snatch, Clean & Jerk, or Total)
-            if first_col.lower() in ["snatch", "clean & jerk", "clean and jerk", "c&j", "total"]:
+            lift_kind = _LIFT_KINDS.get(first_col_lower)
+            if lift_kind is not None:
                 # Extract weight value from column D (index 3)
-                weight_value = None
-                if len(row) > 3 and row[3].strip():
-                    try:
-                        # Convert to int (weights are always whole numbers in kg)
-                        weight_value = int(float(row[3].strip()))
-                    except ValueError:
-                        pass
+                weight_value = self._parse_weight(row[3]) if len(row) > 3 else None
                 
                 # Store the lift value
-                lift_type = first_col.lower()
-                if lift_type == "snatch":
+                if lift_kind == "snatch":
                     current_snatch = weight_value
-                elif lift_type in ["clean & jerk", "clean and jerk", "c&j"]:
+                elif lift_kind == "cj":
                     current_cj = weight_value
-                elif lift_type == "total":
+                else:
                     current_total = weight_value
                     # After total, save the record
                     save_current_record()
@@ -375,7 +496,7 @@ class WSORecordsScraper:
                     current_total = None
             
             # Check if this is a weight class row
-            elif "kg" in first_col.lower():
+            elif "kg" in first_col_lower:
                 # Save previous record if exists
                 save_current_record()
                 
@@ -386,7 +507,7 @@ class WSORecordsScraper:
                 current_total = None
             
             # Check if this is an age subdivision row (text in col A, empty col B)
-            elif not second_col:
+            elif len(row) < 2 or not row[1].strip():
                 # This is likely an age subdivision
                 # Parse and normalize the age subdivision
                 parsed = parse_age_subdivision(first_col)
@@ -400,50 +521,79 @@ class WSORecordsScraper:
         
         return records
     
-    def upsert_records(self, records: List[Dict[str, Any]]) -> None:
+    def _parse_weight(self, value: str) -> Optional[int]:
+        """Parse a lift weight cell, return None if empty or invalid."""
+        value = value.strip()
+        
+        # Weights are almost always plain whole numbers in kg
+        if value.isdecimal():
+            return int(value)
+        if not value:
+            return None
+        
+        try:
+            return int(float(value))
+        except ValueError:
+            return None
+    
+    def fetch_existing_records(self) -> Dict[Tuple[str, str, str], Dict[str, Any]]:
+        """
+        Fetch all existing records for this WSO in one query.
+        
+        Returns:
+            Dict of existing rows keyed by (age_category, gender, weight_class)
+        """
+        existing = self.supabase_client.table("wso_records").select(
+            "age_category,gender,weight_class,snatch_record,cj_record,total_record"
+        ).eq("wso", self.wso_name).execute()
+        return {
+            (row["age_category"], row["gender"], row["weight_class"]): row
+            for row in existing.data
+        }
+    
+    def upsert_records(self, records: List[Dict[str, Any]],
+                       existing_by_key: Optional[Dict[Tuple[str, str, str], Dict[str, Any]]] = None) -> None:
         """
         Upsert records to Supabase.
         
+        Records are diffed locally against the WSO's existing records; all new
+        and changed records are then written with bulk upserts on
+        (wso, age_category, gender, weight_class).
+        
         Tracks changes (inserts vs updates) in self.changes.
         
         Args:
             records: List of records to upsert
+            existing_by_key: Result of fetch_existing_records(), fetched here if not given
         """
+        if existing_by_key is None:
+            existing_by_key = self.fetch_existing_records()
+        
+        # Keyed so a duplicate record in the scrape replaces the earlier one
+        to_upsert = {}
+        
         for record in records:
-            # Query for existing record with same unique key
-            existing = self.supabase_client.table("wso_records").select("*").match({
-                "wso": record["wso"],
-                "age_category": record["age_category"],
-                "gender": record["gender"],
-                "weight_class": record["weight_class"]
-            }).execute()
+            key = (record["age_category"], record["gender"], record["weight_class"])
+            existing_record = existing_by_key.get(key)
             
-            if existing.data and len(existing.data) > 0:
+            if existing_record is not None:
                 # Record exists - check if update is needed
-                existing_record = existing.data[0]
-                record_id = existing_record["id"]
+                old_lifts = (
+                    existing_record.get("snatch_record"),
+                    existing_record.get("cj_record"),
+                    existing_record.get("total_record"),
+                )
+                new_lifts = (record["snatch_record"], record["cj_record"], record["total_record"])
                 
-                # Compare values to see what changed
-                changes = {}
-                if existing_record.get("snatch_record") != record.get("snatch_record"):
-                    changes["snatch_record"] = {
-                        "old": existing_record.get("snatch_record"),
-                        "new": record.get("snatch_record")
-                    }
-                if existing_record.get("cj_record") != record.get("cj_record"):
-                    changes["cj_record"] = {
-                        "old": existing_record.get("cj_record"),
-                        "new": record.get("cj_record")
+                # Unchanged records are the common case; only build a diff otherwise
+                if old_lifts != new_lifts:
+                    changes = {
+                        field: {"old": old, "new": new}
+                        for field, old, new in zip(_LIFT_FIELDS, old_lifts, new_lifts)
+                        if old != new
                     }
-                if existing_record.get("total_record") != record.get("total_record"):
-                    changes["total_record"] = {
-                        "old": existing_record.get("total_record"),
-                        "new": record.get("total_record")
-                    }
-                
-                if changes:
-                    # Update the record
-                    self.supabase_client.table("wso_records").update(record).eq("id", record_id).execute()
+                    
+                    to_upsert[key] = record
                     
                     # Track the update
                     self.changes["updated"].append({
@@ -456,7 +606,7 @@ class WSORecordsScraper:
                     print(f"  ✓ Updated: {record['age_category']} {record['gender']} {record['weight_class']}")
             else:
                 # Record doesn't exist - insert it
-                self.supabase_client.table("wso_records").insert(record).execute()
+                to_upsert[key] = record
                 
                 # Track the insertion
                 self.changes["inserted"].append({
@@ -469,6 +619,19 @@ class WSORecordsScraper:
                     "total_record": record.get("total_record")
                 })
                 print(f"  ✓ Inserted: {record['age_category']} {record['gender']} {record['weight_class']}")
+            
+            # Later duplicates in the scrape are diffed against this record
+            existing_by_key[key] = record
+        
+        # Write all inserts and updates in bulk, chunked to stay under payload limits.
+        # The written rows aren't needed back, so skip echoing them in the response.
+        rows = list(to_upsert.values())
+        for start in range(0, len(rows), _UPSERT_BATCH_SIZE):
+            self.supabase_client.table("wso_records").upsert(
+                rows[start:start + _UPSERT_BATCH_SIZE],
+                on_conflict="wso,age_category,gender,weight_class",
+                returning=ReturnMethod.minimal
+            ).execute()
     
     def send_discord_notification(self) -> None:
         """Send Discord notification with change summary."""
@@ -480,9 +643,9 @@ class WSORecordsScraper:
             embed = {
                 "title": f"📊 {self.wso_name} WSO Records - No Changes",
                 "description": "Scraper ran successfully. No new records or updates.",
-                "color": 5814783,  # Blue color
-                "timestamp": datetime.utcnow().isoformat(),
-                "footer": {"text": "WSO Records Scraper"}
+                "color": _COLOR_BLUE,
+                "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "footer": _EMBED_FOOTER
             }
             payload = {"embeds": [embed]}
         else:
@@ -498,22 +661,15 @@ class WSORecordsScraper:
             # Add inserted records
             if total_inserted > 0:
                 inserted_text = []
-                for record in self.changes["inserted"][:10]:  # Limit to 10 to avoid message size issues
-                    lifts = []
-                    if record.get("snatch_record"):
-                        lifts.append(f"Snatch: {record['snatch_record']}kg")
-                    if record.get("cj_record"):
-                        lifts.append(f"C&J: {record['cj_record']}kg")
-                    if record.get("total_record"):
-                        lifts.append(f"Total: {record['total_record']}kg")
-                    
-                    lifts_str = ", ".join(lifts) if lifts else "No records"
-                    inserted_text.append(
-                        f"• **{record['age_category']}** | {record['gender']} | {record['weight_class']}\n  {lifts_str}"
-                    )
+                for record in self.changes["inserted"][:_DISCORD_MAX_LISTED]:
+                    lifts_str = ", ".join(
+                        f"{_LIFT_LABELS[field]}: {record[field]}kg"
+                        for field in _LIFT_FIELDS if record.get(field)
+                    ) or "No records"
+                    inserted_text.append(_RECORD_LINE.format(detail=lifts_str, **record))
                 
-                if total_inserted > 10:
-                    inserted_text.append(f"_...and {total_inserted - 10} more_")
+                if total_inserted > _DISCORD_MAX_LISTED:
+                    inserted_text.append(f"_...and {total_inserted - _DISCORD_MAX_LISTED} more_")
                 
                 fields.append({
                     "name": "🆕 New Records",
@@ -524,20 +680,17 @@ class WSORecordsScraper:
             # Add updated records
             if total_updated > 0:
                 updated_text = []
-                for record in self.changes["updated"][:10]:  # Limit to 10
+                for record in self.changes["updated"][:_DISCORD_MAX_LISTED]:
                     changes_str = []
                     for field, change in record["changes"].items():
-                        field_name = field.replace("_record", "").replace("cj", "C&J").title()
                         old = f"{change['old']}kg" if change['old'] else "None"
                         new = f"{change['new']}kg" if change['new'] else "None"
-                        changes_str.append(f"{field_name}: {old} → {new}")
+                        changes_str.append(f"{_LIFT_LABELS[field]}: {old} → {new}")
                     
-                    updated_text.append(
-                        f"• **{record['age_category']}** | {record['gender']} | {record['weight_class']}\n  {', '.join(changes_str)}"
-                    )
+                    updated_text.append(_RECORD_LINE.format(detail=", ".join(changes_str), **record))
                 
-                if total_updated > 10:
-                    updated_text.append(f"_...and {total_updated - 10} more_")
+                if total_updated > _DISCORD_MAX_LISTED:
+                    updated_text.append(f"_...and {total_updated - _DISCORD_MAX_LISTED} more_")
                 
                 fields.append({
                     "name": "📝 Updated Records",
@@ -548,16 +701,22 @@ class WSORecordsScraper:
             embed = {
                 "title": f"📊 {self.wso_name} WSO Records Update",
                 "description": "\n".join(description_parts),
-                "color": 3066993,  # Green color
+                "color": _COLOR_GREEN,
                 "fields": fields,
-                "timestamp": datetime.utcnow().isoformat(),
-                "footer": {"text": "WSO Records Scraper"}
+                "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "footer": _EMBED_FOOTER
             }
             payload = {"embeds": [embed]}
         
-        # Send to Discord
+        # Send to Discord, encoded compactly (no padding, emoji as raw UTF-8)
+        body = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
         try:
-            response = requests.post(self.discord_webhook_url, json=payload)
+            response = self.http.post(
+                self.discord_webhook_url,
+                data=body,
+                headers={"Content-Type": "application/json"},
+                timeout=_HTTP_TIMEOUT
+            )
             response.raise_for_status()
             print("✓ Discord notification sent")
         except Exception as e:
@@ -573,14 +732,19 @@ class WSORecordsScraper:
         self.setup_supabase_client()
         self.setup_discord()
         
-        # Scrape data
-        print("Scraping Google Sheet...")
-        records = self.scrape_sheet()
-        print(f"Found {len(records)} records")
+        # Scrape data while the existing records are loaded from Supabase
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            existing_future = executor.submit(self.fetch_existing_records)
+            
+            print("Scraping Google Sheet...")
+            records = self.scrape_sheet()
+            print(f"Found {len(records)} records")
+            
+            existing_by_key = existing_future.result()
         
         # Upsert to database
         print("Upserting records to Supabase...")
-        self.upsert_records(records)
+        self.upsert_records(records, existing_by_key)
         
         # Send notification
         print("Sending Discord notification...")
@@ -592,11 +756,46 @@ class WSORecordsScraper:
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description="WSO Records Scraper")
-    parser.add_argument("--wso", required=True, help="WSO name (e.g., 'Ohio')")
-    parser.add_argument("--sheet-url", required=True, help="Google Sheet URL")
+    parser.add_argument("--wso", help="WSO name (e.g., 'Ohio')")
+    parser.add_argument("--sheet-url", help="Google Sheet URL")
+    parser.add_argument(
+        "--wso-config",
+        help='JSON file listing several WSOs to scrape, e.g. [{"wso": "Ohio", "sheet_url": "..."}]'
+    )
     
     args = parser.parse_args()
     
+    if args.wso_config:
+        with open(args.wso_config) as f:
+            configs = json.load(f)
+        
+        # Share the HTTP session and Supabase client across all WSOs; a failing
+        # WSO is logged and skipped so the rest still run
+        http = _create_http_session()
+        supabase_client = None
+        failed = []
+        for config in configs:
+            try:
+                scraper = WSORecordsScraper(
+                    config["wso"], config["sheet_url"],
+                    supabase_client=supabase_client, http=http
+                )
+                scraper.run()
+                supabase_client = scraper.supabase_client or supabase_client
+            except Exception as e:
+                print(f"✗ Error scraping {config.get('wso')}: {e}")
+                import traceback
+                traceback.print_exc()
+                failed.append(config.get("wso"))
+        
+        if failed:
+            print(f"✗ {len(failed)} of {len(configs)} WSOs failed: {', '.join(map(str, failed))}")
+            sys.exit(1)
+        return
+    
+    if not args.wso or not args.sheet_url:
+        parser.error("--wso and --sheet-url are required unless --wso-config is given")
+    
     scraper = WSORecordsScraper(args.wso, args.sheet_url)
     scraper.run()
 
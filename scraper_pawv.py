@@ -20,11 +20,19 @@ PA/WV format characteristics:
 
 import os
 import sys
+import io
 import csv
+import json
+import re
 import argparse
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 import requests
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import List, Dict, Any, Iterable, Optional, Tuple
+from datetime import datetime, timezone
 from dotenv import load_dotenv
 
 try:
@@ -34,6 +42,124 @@ except ImportError:
     sys.exit(1)
 
 
+# Maximum number of tab CSVs fetched from Google Sheets at once
+_MAX_FETCH_WORKERS = 8
+
+# Masters age range in a section header, e.g. "(35-39)"
+_MASTERS_RANGE_RE = re.compile(r'\((\d+)-\d+\)')
+
+# Weight class labels: "+65kg" (plus category) and "40kg"
+_PLUS_WEIGHT_RE = re.compile(r'\+(\d+)')
+_WEIGHT_RE = re.compile(r'(\d+)')
+
+# Keywords that mark a Youth/Masters section header
+_SECTION_HEADER_RE = re.compile(r'Age Group|Masters')
+
+# Lift row label -> record field
+_LIFT_FIELDS = {"Snatch": "snatch_record", "Clean & Jerk": "cj_record", "Total": "total_record"}
+
+# Maximum number of rows sent to Supabase in a single upsert request
+_UPSERT_BATCH_SIZE = 500
+
+
+def _create_http_session() -> requests.Session:
+    """Create a pooled HTTP session that retries GETs on rate limits and server errors."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=_MAX_FETCH_WORKERS,
+        pool_maxsize=_MAX_FETCH_WORKERS,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504)
+        )
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@functools.lru_cache(maxsize=512)
+def _normalize_age_category(section_header: str, base_age: str) -> Optional[str]:
+    """
+    Parse section header to get age category.
+    
+    Cached, since every tab repeats the same few section headers.
+    
+    Examples:
+    - "Men's 13 Under Age Group" -> "U13"
+    - "Men's 14-15 Age Group" -> "U15"
+    - "Men's 16-17 Age Group" -> "U17"
+    - "Women's Masters (35-39)" -> "Masters 35"
+    - "Women's Masters (40-44)" -> "Masters 40"
+    
+    For Junior/Senior tabs, there's no subdivision - just return the base age.
+    """
+    header = section_header.strip()
+    
+    # Youth subdivisions
+    if "13" in header and "Under" in header:
+        return "U13"
+    elif "14-15" in header or "14 - 15" in header:
+        return "U15"
+    elif "16-17" in header or "16 - 17" in header:
+        return "U17"
+    
+    # Masters subdivisions
+    if "Masters" in header:
+        # Extract age range: (35-39) -> Masters 35
+        match = _MASTERS_RANGE_RE.search(header)
+        if match:
+            lower_age = match.group(1)
+            return f"Masters {lower_age}"
+    
+    # Junior/Senior have no subdivisions
+    if base_age in ["Junior", "Senior"]:
+        return base_age
+    
+    return None
+
+
+@functools.lru_cache(maxsize=512)
+def _normalize_weight_class(weight_str: str) -> Optional[str]:
+    """
+    Normalize weight class format.
+    
+    Cached, since each tab repeats the same weight class labels.
+    
+    Examples:
+    - "40kg" -> "40"
+    - "+65kg" -> "65+"
+    - "65+" -> "65+"
+    """
+    weight_str = weight_str.strip()
+    
+    # Handle "+Xkg" format
+    if weight_str.startswith("+"):
+        match = _PLUS_WEIGHT_RE.search(weight_str)
+        if match:
+            return match.group(1) + "+"
+    
+    # Handle "Xkg" format
+    match = _WEIGHT_RE.search(weight_str)
+    if match:
+        return match.group(1)
+    
+    return None
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_int(value: str) -> Optional[int]:
+    """Parse integer value, return None if invalid. Cached, since lift values repeat."""
+    if not value or value.strip() == "" or value.strip().upper() == "STANDARD":
+        return None
+    try:
+        return int(float(value.strip()))
+    except (ValueError, AttributeError):
+        return None
+
+
+
 class WSORecordsPAWVScraper:
     """Scraper for Pennsylvania-West Virginia WSO records."""
     
@@ -49,6 +175,7 @@ class WSORecordsPAWVScraper:
         self.base_sheet_id = base_sheet_id
         self.supabase: Optional[Client] = None
         self.discord_webhook_url: Optional[str] = None
+        self.http = _create_http_session()
         
         # Tab configuration: gender + base age category + GID
         # Format: (gender, base_age_category, gid)
@@ -80,266 +207,193 @@ class WSORecordsPAWVScraper:
         if self.discord_webhook_url:
             print("✓ Discord webhook configured")
     
-    def fetch_csv_data(self, gid: str) -> str:
+    def scrape_tab(self, gender: str, base_age_category: str, gid: str) -> List[Dict[str, Any]]:
         """
-        Fetch CSV data for a specific tab.
+        Scrape a single tab.
         
         Args:
-            gid: The tab GID
+            gender: "Men" or "Women"
+            base_age_category: "Youth", "Junior", "Senior", or "Masters"
+            gid: Tab GID
             
         Returns:
-            CSV content as string
+            List of record dictionaries
         """
         # Published sheets use a different URL format
         csv_url = f"https://docs.google.com/spreadsheets/d/e/{self.base_sheet_id}/pub?gid={gid}&single=true&output=csv"
         
-        response = requests.get(csv_url, timeout=30)
-        response.raise_for_status()
-        return response.text
-    
-    def _normalize_age_category(self, section_header: str, base_age: str) -> Optional[str]:
-        """
-        Parse section header to get age category.
-        
-        Examples:
-        - "Men's 13 Under Age Group" -> "U13"
-        - "Men's 14-15 Age Group" -> "U15"
-        - "Men's 16-17 Age Group" -> "U17"
-        - "Women's Masters (35-39)" -> "Masters 35"
-        - "Women's Masters (40-44)" -> "Masters 40"
-        
-        For Junior/Senior tabs, there's no subdivision - just return the base age.
-        """
-        header = section_header.strip()
-        
-        # Youth subdivisions
-        if "13" in header and "Under" in header:
-            return "U13"
-        elif "14-15" in header or "14 - 15" in header:
-            return "U15"
-        elif "16-17" in header or "16 - 17" in header:
-            return "U17"
-        
-        # Masters subdivisions
-        if "Masters" in header:
-            # Extract age range: (35-39) -> Masters 35
-            import re
-            match = re.search(r'\((\d+)-\d+\)', header)
-            if match:
-                lower_age = match.group(1)
-                return f"Masters {lower_age}"
-        
-        # Junior/Senior have no subdivisions
-        if base_age in ["Junior", "Senior"]:
-            return base_age
-        
-        return None
-    
-    def _normalize_weight_class(self, weight_str: str) -> Optional[str]:
-        """
-        Normalize weight class format.
-        
-        Examples:
-        - "40kg" -> "40"
-        - "+65kg" -> "65+"
-        - "65+" -> "65+"
-        """
-        import re
-        
-        weight_str = weight_str.strip()
-        
-        # Handle "+Xkg" format
-        if weight_str.startswith("+"):
-            match = re.search(r'\+(\d+)', weight_str)
-            if match:
-                return match.group(1) + "+"
-        
-        # Handle "Xkg" format
-        match = re.search(r'(\d+)', weight_str)
-        if match:
-            return match.group(1)
-        
-        return None
+        # Stream the CSV straight into the parser (Sheets exports UTF-8)
+        with self.http.get(csv_url, stream=True, timeout=30) as response:
+            response.raise_for_status()
+            # newline="" leaves line endings to csv so quoted multi-line cells stay intact
+            response.raw.decode_content = True
+            rows = csv.reader(io.TextIOWrapper(response.raw, encoding="utf-8", newline=""))
+            return self._parse_rows(rows, gender, base_age_category)
     
-    def _parse_int(self, value: str) -> Optional[int]:
-        """Parse integer value, return None if invalid."""
-        if not value or value.strip() == "" or value.strip().upper() == "STANDARD":
-            return None
-        try:
-            return int(float(value.strip()))
-        except (ValueError, AttributeError):
-            return None
-    
-    def scrape_tab(self, gender: str, base_age_category: str, gid: str) -> List[Dict[str, Any]]:
+    def _parse_rows(self, rows: Iterable[List[str]], gender: str, base_age_category: str) -> List[Dict[str, Any]]:
         """
-        Scrape a single tab.
+        Parse a tab's CSV rows into records.
         
         Args:
+            rows: CSV rows of the tab
             gender: "Men" or "Women"
             base_age_category: "Youth", "Junior", "Senior", or "Masters"
-            gid: Tab GID
             
         Returns:
             List of record dictionaries
         """
-        csv_text = self.fetch_csv_data(gid)
-        lines = csv_text.strip().split('\n')
-        reader = csv.reader(lines)
-        rows = list(reader)
-        
         records = []
         current_age_category = None
         current_weight_class = None
-        current_snatch = None
-        current_cj = None
-        current_total = None
+        current_lifts = dict.fromkeys(_LIFT_FIELDS.values())
         
-        # For Junior/Senior tabs, there's no age subdivision - just use base category
+        # For Junior/Senior tabs, there's no age subdivision - just use base category,
+        # and the tab's "Junior Men's" / "Open Women's" label rows are skipped
+        tab_label_re = None
         if base_age_category in ["Junior", "Senior"]:
             current_age_category = base_age_category
+            tab_label_re = re.compile("|".join(
+                re.escape(label)
+                for label in (f"{base_age_category} {gender}", f"Open {gender}", f"{gender}'s")
+            ))
         
-        for i, row in enumerate(rows):
+        for row in rows:
             if not row or len(row) < 4:
                 continue
             
+            first_col = row[0].strip()
+            
+            # Lift rows (Snatch, Clean & Jerk, Total) make up most of a tab and match
+            # none of the header checks below, so resolve them with one dict lookup
+            field = _LIFT_FIELDS.get(first_col)
+            if field:
+                # Extract weight value from column 3 (index 3)
+                current_lifts[field] = _parse_int(row[3].strip())
+                continue
+            
             # Check if this is an age group header
             # Format: "Men's 13 Under Age Group" or "Women's Masters (35-39)"
             # or "Junior Men's" / "Open Women's"
-            first_col = row[0].strip()
             
             # For Youth/Masters, look for specific section headers
-            if ("Age Group" in first_col or "Masters" in first_col) and \
+            if _SECTION_HEADER_RE.search(first_col) and \
                (gender in first_col or "Men's" in first_col or "Women's" in first_col):
                 # This is a section header
-                age_cat = self._normalize_age_category(first_col, base_age_category)
+                age_cat = _normalize_age_category(first_col, base_age_category)
                 if age_cat:
                     current_age_category = age_cat
                     # Reset weight class tracking
                     current_weight_class = None
-                    current_snatch = None
-                    current_cj = None
-                    current_total = None
+                    current_lifts = dict.fromkeys(_LIFT_FIELDS.values())
                 continue
             
             # For Junior/Senior, check for simple "Junior Men's" or "Open Women's" header
-            if base_age_category in ["Junior", "Senior"] and \
-               (f"{base_age_category} {gender}" in first_col or 
-                f"Open {gender}" in first_col or
-                f"{gender}'s" in first_col):
+            if tab_label_re and tab_label_re.search(first_col):
                 # This is just a label, age_category is already set
                 continue
             
-            # Check if this is a weight class header (e.g., "40kg", "+65kg")
-            if first_col.endswith("kg") or (first_col.startswith("+") and "kg" in first_col):
+            # Check if this is a weight class header (e.g., "40kg", "+65kg"); every
+            # weight label contains "kg", so other rows are rejected with one scan
+            if "kg" in first_col and (first_col.endswith("kg") or first_col.startswith("+")):
                 # Save previous weight class if complete
                 if current_weight_class and current_age_category:
-                    record = {
-                        'wso': self.wso_name,
-                        'age_category': current_age_category,
-                        'gender': gender,
-                        'weight_class': current_weight_class,
-                        'snatch_record': current_snatch,
-                        'cj_record': current_cj,
-                        'total_record': current_total
-                    }
-                    records.append(record)
+                    records.append(self._build_record(
+                        current_age_category, gender, current_weight_class, current_lifts
+                    ))
                 
                 # Start new weight class
-                weight_class = self._normalize_weight_class(first_col)
+                weight_class = _normalize_weight_class(first_col)
                 if weight_class:
                     current_weight_class = weight_class
-                    current_snatch = None
-                    current_cj = None
-                    current_total = None
+                    current_lifts = dict.fromkeys(_LIFT_FIELDS.values())
                 continue
-            
-            # Check if this is a lift row (Snatch, Clean & Jerk, Total)
-            lift_type = first_col
-            if lift_type in ["Snatch", "Clean & Jerk", "Total"]:
-                # Extract weight value from column 3 (index 3)
-                weight_val = row[3].strip() if len(row) > 3 else ""
-                parsed_weight = self._parse_int(weight_val)
-                
-                if lift_type == "Snatch":
-                    current_snatch = parsed_weight
-                elif lift_type == "Clean & Jerk":
-                    current_cj = parsed_weight
-                elif lift_type == "Total":
-                    current_total = parsed_weight
         
         # Save last weight class if present
         if current_weight_class and current_age_category:
-            record = {
-                'wso': self.wso_name,
-                'age_category': current_age_category,
-                'gender': gender,
-                'weight_class': current_weight_class,
-                'snatch_record': current_snatch,
-                'cj_record': current_cj,
-                'total_record': current_total
-            }
-            records.append(record)
+            records.append(self._build_record(
+                current_age_category, gender, current_weight_class, current_lifts
+            ))
         
         return records
     
+    def _build_record(self, age_category: str, gender: str, weight_class: str,
+                      lifts: Dict[str, Optional[int]]) -> Dict[str, Any]:
+        """Build a record dict for one weight class from its lift values."""
+        return {
+            'wso': self.wso_name,
+            'age_category': age_category,
+            'gender': gender,
+            'weight_class': weight_class,
+            **lifts
+        }
+    
     def scrape_all_tabs(self) -> List[Dict[str, Any]]:
         """Scrape all tabs and return combined records."""
         all_records = []
         
-        for gender, base_age, gid in self.tabs:
+        # Fetch and parse all tabs concurrently (network-bound), then collect
+        # the results in tab order
+        with ThreadPoolExecutor(max_workers=_MAX_FETCH_WORKERS) as executor:
+            futures = [
+                executor.submit(self.scrape_tab, gender, base_age, gid)
+                for gender, base_age, gid in self.tabs
+            ]
+        
+        for (gender, base_age, gid), future in zip(self.tabs, futures):
             print(f"  Scraping {gender} {base_age} (gid={gid})...")
-            tab_records = self.scrape_tab(gender, base_age, gid)
+            tab_records = future.result()
             all_records.extend(tab_records)
             print(f"    Found {len(tab_records)} records")
         
         return all_records
     
+    def _load_existing_index(self) -> Dict[Tuple[str, str, str, str], Dict[str, Any]]:
+        """Fetch this WSO's existing records in one query, keyed by (wso, age_category, gender, weight_class)."""
+        existing = self.supabase.table('wso_records').select('*').eq('wso', self.wso_name).execute()
+        index = {}
+        for row in existing.data:
+            # The unique key (migrations/001_wso_records_unique_key.sql) allows one row
+            # per key; first-wins only matters on a database that predates it
+            index.setdefault((row['wso'], row['age_category'], row['gender'], row['weight_class']), row)
+        return index
+    
     def upsert_to_supabase(self, records: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
         """
         Upsert records to Supabase.
         
+        Diffs against the WSO's existing records in memory, then writes all new
+        and changed records with bulk upserts on
+        (wso, age_category, gender, weight_class).
+        
         Returns:
             Dictionary with 'inserted' and 'updated' lists
         """
         if not self.supabase:
             raise ValueError("Supabase client not initialized")
         
-        inserted = []
-        updated = []
+        comparison = self._diff(records, self._load_existing_index())
+        inserted = comparison['to_insert']
+        updated = [item['record'] for item in comparison['to_update']]
         
-        for record in records:
-            # Check if record exists
-            existing = self.supabase.table('wso_records').select('*').eq(
-                'wso', record['wso']
-            ).eq(
-                'age_category', record['age_category']
-            ).eq(
-                'gender', record['gender']
-            ).eq(
-                'weight_class', record['weight_class']
+        for record in inserted:
+            print(f"  ✓ Inserted: {record['age_category']} {record['gender']} {record['weight_class']}")
+        for record in updated:
+            print(f"  ✓ Updated: {record['age_category']} {record['gender']} {record['weight_class']}")
+        
+        # Final row to write per key; a weight class scraped twice is written once
+        # with its last values (updates always follow the insert of their key)
+        to_upsert = {
+            (record['wso'], record['age_category'], record['gender'], record['weight_class']): record
+            for record in chain(inserted, updated)
+        }
+        
+        # Write all inserts and updates in bulk, chunked to stay under payload limits
+        rows = list(to_upsert.values())
+        for start in range(0, len(rows), _UPSERT_BATCH_SIZE):
+            self.supabase.table('wso_records').upsert(
+                rows[start:start + _UPSERT_BATCH_SIZE],
+                on_conflict='wso,age_category,gender,weight_class'
             ).execute()
-            
-            if existing.data:
-                # Update existing record
-                db_record = existing.data[0]
-                record_id = db_record['id']
-                
-                # Check if any values changed
-                changed = False
-                for field in ['snatch_record', 'cj_record', 'total_record']:
-                    if db_record.get(field) != record.get(field):
-                        changed = True
-                        break
-                
-                if changed:
-                    self.supabase.table('wso_records').update(record).eq('id', record_id).execute()
-                    updated.append(record)
-                    print(f"  ✓ Updated: {record['age_category']} {record['gender']} {record['weight_class']}")
-            else:
-                # Insert new record
-                self.supabase.table('wso_records').insert(record).execute()
-                inserted.append(record)
-                print(f"  ✓ Inserted: {record['age_category']} {record['gender']} {record['weight_class']}")
         
         return {'inserted': inserted, 'updated': updated}
     
@@ -353,7 +407,7 @@ class WSORecordsPAWVScraper:
         embed = {
             "title": f"{self.wso_name} WSO Records Update",
             "color": 0x00ff00 if (inserted or updated) else 0x808080,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
             "fields": []
         }
         
@@ -366,10 +420,10 @@ class WSORecordsPAWVScraper:
         
         # Inserted records
         if inserted:
-            inserted_text = "\n".join([
+            inserted_text = "\n".join(
                 f"• {r['age_category']} {r['gender']} {r['weight_class']}"
                 for r in inserted[:10]  # Limit to first 10
-            ])
+            )
             if len(inserted) > 10:
                 inserted_text += f"\n... and {len(inserted) - 10} more"
             
@@ -381,10 +435,10 @@ class WSORecordsPAWVScraper:
         
         # Updated records
         if updated:
-            updated_text = "\n".join([
+            updated_text = "\n".join(
                 f"• {r['age_category']} {r['gender']} {r['weight_class']}"
                 for r in updated[:10]  # Limit to first 10
-            ])
+            )
             if len(updated) > 10:
                 updated_text += f"\n... and {len(updated) - 10} more"
             
@@ -396,7 +450,14 @@ class WSORecordsPAWVScraper:
         
         payload = {"embeds": [embed]}
         
-        response = requests.post(self.discord_webhook_url, json=payload, timeout=10)
+        # Encode compactly (no padding, non-ASCII as raw UTF-8) and reuse the pooled session
+        body = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        response = self.http.post(
+            self.discord_webhook_url,
+            data=body,
+            headers={"Content-Type": "application/json"},
+            timeout=10
+        )
         response.raise_for_status()
         print("✓ Discord notification sent")
     
@@ -410,43 +471,47 @@ class WSORecordsPAWVScraper:
         if not self.supabase:
             raise ValueError("Supabase client not initialized")
         
+        return self._diff(records, self._load_existing_index())
+    
+    def _diff(self, records: List[Dict[str, Any]],
+              existing_by_key: Dict[Tuple[str, str, str, str], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Diff scraped records against the existing-record index.
+        
+        The index is updated as records are classified, so a weight class scraped
+        twice is compared against its first occurrence rather than inserted twice.
+        
+        Returns:
+            Dictionary with 'to_insert' and 'to_update' lists and the 'unchanged' count
+        """
         to_insert = []
         to_update = []
-        unchanged = []
+        unchanged = 0
         
         for record in records:
-            existing = self.supabase.table('wso_records').select('*').eq(
-                'wso', record['wso']
-            ).eq(
-                'age_category', record['age_category']
-            ).eq(
-                'gender', record['gender']
-            ).eq(
-                'weight_class', record['weight_class']
-            ).execute()
+            key = (record['wso'], record['age_category'], record['gender'], record['weight_class'])
+            db_record = existing_by_key.get(key)
             
-            if existing.data:
-                db_record = existing.data[0]
-                
-                # Check for changes
-                changed = False
-                changes = []
-                for field in ['snatch_record', 'cj_record', 'total_record']:
-                    db_val = db_record.get(field)
-                    new_val = record.get(field)
-                    if db_val != new_val:
-                        changed = True
-                        changes.append((field, db_val, new_val))
-                
-                if changed:
-                    to_update.append({
-                        'record': record,
-                        'changes': changes
-                    })
-                else:
-                    unchanged.append(record)
-            else:
+            if db_record is None:
                 to_insert.append(record)
+                existing_by_key[key] = record
+                continue
+            
+            # Check for changes
+            changes = [
+                (field, db_record.get(field), record.get(field))
+                for field in _LIFT_FIELDS.values()
+                if db_record.get(field) != record.get(field)
+            ]
+            
+            if changes:
+                to_update.append({
+                    'record': record,
+                    'changes': changes
+                })
+                existing_by_key[key] = record
+            else:
+                unchanged += 1
         
         return {
             'to_insert': to_insert,
@@ -484,7 +549,7 @@ class WSORecordsPAWVScraper:
             
             print(f"\nTo INSERT: {len(comparison['to_insert'])} records")
             print(f"To UPDATE: {len(comparison['to_update'])} records")
-            print(f"Unchanged: {len(comparison['unchanged'])} records")
+            print(f"Unchanged: {comparison['unchanged']} records")
             
             if comparison['to_insert']:
                 print("\n--- Records to INSERT ---")
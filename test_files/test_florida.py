@@ -6,6 +6,7 @@ Basic test script for Florida WSO scraper
 import sys
 import os
 import json
+from dataclasses import asdict
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -31,15 +32,15 @@ def main():
     print(f"\nSample records (first 10):")
     print("=" * 80)
     for i, rec in enumerate(records[:10], 1):
-        print(f"{i}. {rec['age_category']:15} | {rec['gender']:6} | {rec['weight_class']:5}")
-        print(f"   Snatch: {rec.get('snatch_record')}, C&J: {rec.get('cj_record')}, Total: {rec.get('total_record')}")
+        print(f"{i}. {rec.age_category:15} | {rec.gender:6} | {rec.weight_class:5}")
+        print(f"   Snatch: {rec.snatch_record}, C&J: {rec.cj_record}, Total: {rec.total_record}")
     
     if len(records) > 10:
         print(f"\n... and {len(records) - 10} more records")
     
     # Show breakdown by age category
     from collections import Counter
-    age_counts = Counter(r['age_category'] for r in records)
+    age_counts = Counter(r.age_category for r in records)
     print(f"\nBreakdown by age category:")
     for age, count in sorted(age_counts.items()):
         print(f"  {age}: {count} records")
@@ -47,7 +48,7 @@ def main():
     # Save to file for inspection
     output_file = "test_florida_data.json"
     with open(output_file, 'w') as f:
-        json.dump(records, f, indent=2)
+        json.dump([asdict(r) for r in records], f, indent=2)
     print(f"\n✓ Saved to {output_file}")
 
 if __name__ == "__main__":